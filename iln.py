@@ -10,24 +10,146 @@ Release: v2.0.0 - GitHub Releases Optimized
 """
 
 import re
+import os
 import json
 import time
+import mmap
+import zlib
+import queue
+import atexit
+import socket
+import struct
+import signal
+import hashlib
+import sys
 import requests
 import threading
+import asyncio
+import functools
+import itertools
+import multiprocessing
+from collections import OrderedDict, defaultdict, deque
+from multiprocessing import resource_tracker, shared_memory
+from multiprocessing.connection import Client, Listener
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
 from typing import Dict, Any, List, Optional, Union, Callable
-from dataclasses import dataclass, field
-from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, replace, asdict
+from abc import ABC
 import logging
+import logging.handlers
 
 __version__ = "2.0.0"
 __author__ = "Anzize Daouda"
 __email__ = "nexusstudio100@gmail.com"
 __release_date__ = "2024-12-19"
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Logging: per-event counts and sampling; structured records and QueueListener I/O are opt-in
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
 logger = logging.getLogger('ILN')
 
+# Events emitted once per execute() call (suppressed by configure_logging(per_call=False))
+PER_CALL_EVENTS = ('champion_selected', 'execution_timeout', 'execution_error', 'level_requires_pro',
+                   'input_rejected')
+
+class StructuredFormatter(logging.Formatter):
+    """One JSON object per record: timestamp, severity, event, message and event fields"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'ts': record.created,
+            'severity': record.levelname,
+            'logger': record.name,
+            'event': getattr(record, 'iln_event', None),
+            'message': record.getMessage()
+        }
+        payload.update(getattr(record, 'iln_fields', {}))
+        if record.exc_info:
+            payload['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+class _LogState:
+    """Aggregate event counts and sampling periods (every Nth event is emitted)"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts: Dict[str, int] = defaultdict(int)
+        self.periods: Dict[str, int] = {}
+        self.listener: Optional[logging.handlers.QueueListener] = None
+        self.queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+_LOG_STATE = _LogState()
+
+def log_event(event: str, log_level: int, message: str, *args, **fields):
+    """Count an event and, if sampled in and enabled, log it lazily (%-style args)"""
+    with _LOG_STATE.lock:
+        _LOG_STATE.counts[event] += 1
+        count = _LOG_STATE.counts[event]
+    period = _LOG_STATE.periods.get(event, 1)
+    if period == 0 or count % period or not logger.isEnabledFor(log_level):
+        return
+    logger.log(log_level, message, *args, extra={'iln_event': event, 'iln_fields': fields})
+
+def get_log_counts() -> Dict[str, int]:
+    """Per-event totals, including records suppressed by sampling"""
+    with _LOG_STATE.lock:
+        return dict(_LOG_STATE.counts)
+
+def configure_logging(level: int = logging.INFO, sample_rates: Dict[str, float] = None,
+                      per_call: bool = True, structured: bool = False, async_handler: bool = True,
+                      stream=None):
+    """(Re)configure the 'ILN' logger (explicit opt-in; importing iln only calls basicConfig)
+    
+    `sample_rates` maps event -> fraction of records emitted (0 suppresses the
+    record but keeps its count). With `async_handler`, records are handed to a
+    QueueHandler and written by a QueueListener thread, off the request path;
+    the listener is restarted in forked children. The 'ILN' logger then owns its
+    output and stops propagating to the root logger.
+    """
+    periods = {}
+    if not per_call:
+        periods.update({event: 0 for event in PER_CALL_EVENTS})
+    for event, rate in (sample_rates or {}).items():
+        periods[event] = 0 if rate <= 0 else max(1, int(round(1.0 / rate)))
+    _LOG_STATE.periods = periods
+    
+    _stop_log_listener()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    
+    output = logging.StreamHandler(stream)
+    output.setFormatter(StructuredFormatter() if structured else logging.Formatter(LOG_FORMAT))
+    if async_handler:
+        log_queue = queue.SimpleQueue()
+        _LOG_STATE.listener = logging.handlers.QueueListener(log_queue, output)
+        _LOG_STATE.listener.start()
+        _LOG_STATE.queue_handler = logging.handlers.QueueHandler(log_queue)
+        logger.addHandler(_LOG_STATE.queue_handler)
+    else:
+        logger.addHandler(output)
+    logger.setLevel(level)
+    logger.propagate = False
+
+def _stop_log_listener():
+    if _LOG_STATE.listener is not None:
+        _LOG_STATE.listener.stop()
+        _LOG_STATE.listener = None
+        _LOG_STATE.queue_handler = None
+
+def _restart_log_listener():
+    """After fork: the listener thread did not survive, so give the child its own queue and thread"""
+    listener = _LOG_STATE.listener
+    if listener is None:
+        return
+    log_queue = queue.SimpleQueue()
+    _LOG_STATE.listener = logging.handlers.QueueListener(log_queue, *listener.handlers)
+    _LOG_STATE.listener.start()
+    _LOG_STATE.queue_handler.queue = log_queue
+
+atexit.register(_stop_log_listener)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_log_listener)
+
 @dataclass
 class ILNResult:
     """Enhanced ILN execution result"""
@@ -51,19 +173,516 @@ class EngineCapabilities:
     learning_curve: float
     specialty_domains: List[str] = field(default_factory=list)
 
+class ILNTimeoutError(Exception):
+    """Raised when an execution exceeds its deadline or is cancelled"""
+    
+    def __init__(self, message: str, stage: str):
+        super().__init__(message)
+        self.stage = stage
+
+class CancellationToken:
+    """Cooperative cancellation token carrying an execution deadline (time.monotonic based)"""
+    
+    def __init__(self, deadline: Optional[float] = None):
+        self.deadline = deadline
+        self.partial = {}
+        self._cancelled = False
+    
+    @classmethod
+    def from_timeout(cls, timeout: Optional[float]) -> 'CancellationToken':
+        """Create token expiring `timeout` seconds from now"""
+        return cls(time.monotonic() + timeout if timeout is not None else None)
+    
+    def tighten(self, deadline: Optional[float]):
+        """Move deadline earlier (never later)"""
+        if deadline is not None and (self.deadline is None or deadline < self.deadline):
+            self.deadline = deadline
+    
+    def cancel(self):
+        """Request cancellation at the next checkpoint"""
+        self._cancelled = True
+    
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+    
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline, None when unbounded"""
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0.0)
+    
+    def check(self, stage: str):
+        """Raise ILNTimeoutError if cancelled or past the deadline"""
+        if self._cancelled:
+            raise ILNTimeoutError(f"Execution cancelled before {stage}", stage)
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise ILNTimeoutError(f"Deadline exceeded before {stage}", stage)
+
+class ILNAdmissionError(Exception):
+    """Raised when admission control rejects work (saturated scope)"""
+    
+    def __init__(self, message: str, scope: str):
+        super().__init__(message)
+        self.scope = scope
+
+class AdmissionController:
+    """Admission control with bounded wait queues and per-level / per-engine concurrency limits
+    
+    Every level owns its own slots and queue, so Level 3/4 bursts cannot consume
+    Level 1 capacity. On shared engines, Level 3/4 work may hold at most
+    `heavy_engine_share` of an engine's slots.
+    """
+    
+    DEFAULT_LEVEL_LIMITS = {1: 64, 2: 32, 3: 8, 4: 4}
+    
+    def __init__(self, level_limits: Dict[int, int] = None, engine_limits: Dict[str, int] = None,
+                 max_queue: int = 64, queue_timeout: float = 0.05, heavy_engine_share: float = 0.5):
+        self.level_limits = dict(self.DEFAULT_LEVEL_LIMITS if level_limits is None else level_limits)
+        self.engine_limits = dict(engine_limits or {})
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.heavy_engine_share = heavy_engine_share
+        
+        self._cond = threading.Condition()
+        self._active = defaultdict(int)
+        self._waiting = defaultdict(int)
+        self._admitted = defaultdict(int)
+        self._rejected = defaultdict(int)
+        self._queued = defaultdict(int)
+        self._wait_total = defaultdict(float)
+        self._wait_max = defaultdict(float)
+    
+    def acquire_level(self, level: int, timeout: Optional[float] = None):
+        """Take a level slot or raise ILNAdmissionError"""
+        limit = self.level_limits.get(level)
+        scope = f"level:{level}"
+        self._acquire(scope, lambda: limit is None or self._active[scope] < limit, [scope], timeout)
+    
+    def release_level(self, level: int):
+        self._release([f"level:{level}"])
+    
+    def acquire_engine(self, engine: str, level: int, timeout: Optional[float] = None):
+        """Take an engine slot (heavy levels capped to their share) or raise ILNAdmissionError"""
+        limit = self.engine_limits.get(engine)
+        if limit is None:
+            return
+        scope = f"engine:{engine}"
+        if level >= 3:
+            heavy_scope = f"engine:{engine}:heavy"
+            heavy_limit = max(1, int(limit * self.heavy_engine_share))
+            self._acquire(scope, lambda: (self._active[scope] < limit
+                                          and self._active[heavy_scope] < heavy_limit),
+                          [scope, heavy_scope], timeout)
+        else:
+            self._acquire(scope, lambda: self._active[scope] < limit, [scope], timeout)
+    
+    def release_engine(self, engine: str, level: int):
+        if engine not in self.engine_limits:
+            return
+        scopes = [f"engine:{engine}"]
+        if level >= 3:
+            scopes.append(f"engine:{engine}:heavy")
+        self._release(scopes)
+    
+    def _acquire(self, scope: str, has_capacity: Callable[[], bool], counters: List[str],
+                 timeout: Optional[float]):
+        wait_budget = self.queue_timeout if timeout is None else min(self.queue_timeout, timeout)
+        with self._cond:
+            if not has_capacity():
+                # Fast rejection: bounded queue, bounded wait
+                if self._waiting[scope] >= self.max_queue:
+                    self._rejected[scope] += 1
+                    raise ILNAdmissionError(f"Admission rejected: {scope} queue full", scope)
+                
+                self._waiting[scope] += 1
+                self._queued[scope] += 1
+                queued_at = time.monotonic()
+                try:
+                    admitted = self._cond.wait_for(has_capacity, timeout=wait_budget)
+                finally:
+                    self._waiting[scope] -= 1
+                waited = time.monotonic() - queued_at
+                self._wait_total[scope] += waited
+                self._wait_max[scope] = max(self._wait_max[scope], waited)
+                
+                if not admitted:
+                    self._rejected[scope] += 1
+                    raise ILNAdmissionError(f"Admission rejected: {scope} saturated", scope)
+            
+            for counter in counters:
+                self._active[counter] += 1
+            self._admitted[scope] += 1
+    
+    def _release(self, counters: List[str]):
+        with self._cond:
+            for counter in counters:
+                self._active[counter] -= 1
+            self._cond.notify_all()
+    
+    def get_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Per-scope concurrency, queue depth and wait-time metrics"""
+        with self._cond:
+            scopes = set(self._admitted) | set(self._rejected) | set(self._waiting)
+            scopes |= {f"level:{level}" for level in self.level_limits}
+            scopes |= {f"engine:{engine}" for engine in self.engine_limits}
+            metrics = {}
+            for scope in sorted(scopes):
+                kind, key = scope.split(':', 1)
+                limits = self.level_limits if kind == 'level' else self.engine_limits
+                queued = self._queued[scope]
+                metrics[scope] = {
+                    'limit': limits.get(int(key) if kind == 'level' else key),
+                    'active': self._active[scope],
+                    'queue_depth': self._waiting[scope],
+                    'admitted': self._admitted[scope],
+                    'rejected': self._rejected[scope],
+                    'queued': queued,
+                    'avg_wait_time': self._wait_total[scope] / queued if queued else 0.0,
+                    'max_wait_time': self._wait_max[scope]
+                }
+            return metrics
+
+class CircuitBreaker:
+    """Per-engine circuit breaker over a sliding window of recent calls
+    
+    Opens when the error rate or the slow-call rate in the window crosses its
+    threshold; after `cooldown` seconds a single trial call is let through
+    (half-open) and its outcome closes or re-opens the breaker.
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, window: int = 20, min_calls: int = 5, error_rate_threshold: float = 0.5,
+                 slow_call_threshold: float = 1.0, slow_call_rate_threshold: float = 0.5,
+                 cooldown: float = 30.0):
+        self.window = window
+        self.min_calls = min_calls
+        self.error_rate_threshold = error_rate_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.cooldown = cooldown
+        
+        self.state = self.CLOSED
+        self._calls = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._times_opened = 0
+        self._lock = threading.Lock()
+    
+    def allow_request(self) -> bool:
+        """True if a call may go to the engine (does not claim the half-open trial slot)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                return time.monotonic() - self._opened_at >= self.cooldown
+            return not self._trial_in_flight
+    
+    def begin_call(self) -> bool:
+        """Claim the half-open trial slot for a call about to start; True if claimed
+        
+        Claimed right before the engine runs, so selection paths that never reach
+        the engine (cache hits, admission rejections, deadlines) cannot leak it.
+        """
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+    
+    def record(self, success: bool, latency: float, trial: bool = False):
+        """Record a call outcome and update breaker state
+        
+        While half-open only the trial call (see begin_call) decides the next state.
+        """
+        slow = latency >= self.slow_call_threshold
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                if not trial:
+                    return
+                self._trial_in_flight = False
+                if success and not slow:
+                    self.state = self.CLOSED
+                    self._calls.clear()
+                else:
+                    self._trip()
+                return
+            
+            self._calls.append((success, slow))
+            if self.state == self.CLOSED and len(self._calls) >= self.min_calls:
+                error_rate, slow_rate = self._rates()
+                if error_rate >= self.error_rate_threshold or slow_rate >= self.slow_call_rate_threshold:
+                    self._trip()
+    
+    def _trip(self):
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._times_opened += 1
+    
+    def _rates(self) -> tuple:
+        calls = len(self._calls)
+        if not calls:
+            return 0.0, 0.0
+        errors = sum(1 for success, _ in self._calls if not success)
+        slow = sum(1 for _, is_slow in self._calls if is_slow)
+        return errors / calls, slow / calls
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Breaker state and window rates"""
+        with self._lock:
+            error_rate, slow_rate = self._rates()
+            return {
+                'state': self.state,
+                'window_calls': len(self._calls),
+                'error_rate': error_rate,
+                'slow_call_rate': slow_rate,
+                'times_opened': self._times_opened
+            }
+
+class _InFlightCall:
+    """Pending single-flight computation shared by duplicate callers"""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[ILNResult] = None
+
+class SingleFlight:
+    """Coalesces identical in-flight executions, with optional short-TTL result reuse
+    
+    Duplicates block on the leader's computation (thread-safe; asyncio callers go
+    through ILN.execute_async, which waits in an executor thread). Followers get a
+    shallow copy of the leader's ILNResult - the `result` payload is shared and must
+    be treated as read-only.
+    """
+    
+    # Outcomes that depend on the leader's own budget or load, never shared
+    UNSHARED_ERRORS = ('timeout', 'admission_rejected')
+    
+    def __init__(self, result_ttl: float = 0.0, max_results: int = 1024):
+        self.result_ttl = result_ttl
+        self.max_results = max_results
+        self._lock = threading.Lock()
+        self._in_flight: Dict[tuple, _InFlightCall] = {}
+        self._results: 'OrderedDict[tuple, tuple]' = OrderedDict()
+        self._leaders = 0
+        self._coalesced = 0
+        self._ttl_hits = 0
+    
+    @staticmethod
+    def make_key(iln_code: str, level: int, engine: str, context: Dict, kwargs: Dict) -> tuple:
+        """Normalized request key"""
+        return (
+            iln_code.strip(), level, engine,
+            json.dumps(context or {}, sort_keys=True, default=str),
+            json.dumps(kwargs, sort_keys=True, default=str)
+        )
+    
+    def do(self, key: tuple, fn: Callable[[], ILNResult], timeout: Optional[float] = None) -> Optional[ILNResult]:
+        """Run fn once per key among concurrent callers; None if `timeout` expired while waiting"""
+        wait_deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            with self._lock:
+                cached = self._results.get(key)
+                if cached is not None:
+                    if cached[0] > time.monotonic():
+                        self._results.move_to_end(key)
+                        self._ttl_hits += 1
+                        return self._share(cached[1], 'cached')
+                    del self._results[key]
+                
+                call = self._in_flight.get(key)
+                leader = call is None
+                if leader:
+                    call = self._in_flight[key] = _InFlightCall()
+                    self._leaders += 1
+                else:
+                    self._coalesced += 1
+            
+            if leader:
+                try:
+                    call.result = fn()
+                finally:
+                    with self._lock:
+                        del self._in_flight[key]
+                        if self.result_ttl > 0 and self._shareable(call.result):
+                            self._results[key] = (time.monotonic() + self.result_ttl, call.result)
+                            while len(self._results) > self.max_results:
+                                self._results.popitem(last=False)
+                    call.done.set()
+                return call.result
+            
+            remaining = None if wait_deadline is None else max(wait_deadline - time.monotonic(), 0.0)
+            if not call.done.wait(remaining):
+                return None
+            if self._shareable(call.result):
+                return self._share(call.result, 'coalesced')
+            # Leader hit its own deadline or was rejected: retry, possibly as leader
+    
+    def _shareable(self, result: Optional[ILNResult]) -> bool:
+        return result is not None and result.metadata.get('error_type') not in self.UNSHARED_ERRORS
+    
+    @staticmethod
+    def _share(result: ILNResult, how: str) -> ILNResult:
+        """Cheap copy: fresh metadata/metrics dicts, shared result payload"""
+        return replace(result, metadata={**result.metadata, how: True},
+                       performance_metrics=dict(result.performance_metrics),
+                       essences_used=list(result.essences_used))
+    
+    def get_metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'leaders': self._leaders,
+                'coalesced': self._coalesced,
+                'ttl_hits': self._ttl_hits,
+                'in_flight': len(self._in_flight),
+                'cached_results': len(self._results)
+            }
+
+class ResultCache:
+    """Opt-in LRU cache for deterministic engine outputs, bounded by entries, bytes and TTL
+    
+    Results are stored JSON-encoded: the encoded length is the byte cost, and every
+    hit decodes a fresh copy so callers can never mutate a cached entry.
+    """
+    
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 8 * 1024 * 1024, ttl: float = 300.0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: 'OrderedDict[tuple, tuple]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._bypassed = 0
+    
+    @staticmethod
+    def make_key(engine_class: type, method: str, code: str, args: tuple, kwargs: Dict) -> Optional[tuple]:
+        """Cache key, or None when the inputs cannot be keyed
+        
+        Parsed essences are a pure function of the source code and the essence
+        matcher, so the code string and the matcher digest stand in for them;
+        `args` are the remaining engine arguments after the essences.
+        """
+        try:
+            key = (engine_class, method, EssenceProcessor.matcher_digest(), code,
+                   tuple(ResultCache._freeze(arg) for arg in args), ResultCache._freeze(kwargs))
+            hash(key)
+            return key
+        except (TypeError, ValueError):
+            return None
+    
+    @staticmethod
+    def _freeze(value):
+        """Hashable stand-in for a context or kwargs dict (JSON only when values are unhashable)"""
+        if not isinstance(value, dict):
+            return value
+        try:
+            frozen = frozenset(value.items())
+            hash(frozen)
+            return frozen
+        except TypeError:
+            return json.dumps(value, sort_keys=True)
+    
+    def get(self, key: tuple) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            payload = entry[1]
+        return json.loads(payload)
+    
+    def put(self, key: tuple, result: Dict):
+        try:
+            payload = json.dumps(result)
+        except (TypeError, ValueError):
+            return
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + self.ttl, payload, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self._evictions += 1
+    
+    def record_bypass(self):
+        with self._lock:
+            self._bypassed += 1
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+    
+    def _drop(self, key: tuple):
+        self._bytes -= self._entries.pop(key)[2]
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'evictions': self._evictions,
+                'bypassed': self._bypassed
+            }
+
 class ILNEngineRegistry:
     """Modular engine registry for extensibility"""
     
+    PRIORITY_WEIGHTS = {
+        'performance': {'performance_score': 0.5, 'safety_score': 0.1, 'reactivity_score': 0.2, 'ecosystem_score': 0.2},
+        'safety': {'performance_score': 0.2, 'safety_score': 0.5, 'reactivity_score': 0.1, 'ecosystem_score': 0.2},
+        'reactive': {'performance_score': 0.2, 'safety_score': 0.1, 'reactivity_score': 0.5, 'ecosystem_score': 0.2},
+        'balanced': {'performance_score': 0.25, 'safety_score': 0.25, 'reactivity_score': 0.25, 'ecosystem_score': 0.25}
+    }
+    
+    # Engines favoured by each essence (compiled to _BONUS_MASKS)
+    _BONUS_MASKS: Dict[str, int] = {}
+    ESSENCE_BONUSES = {
+        'chan': ['go', 'rust'], 'own': ['rust', 'cpp'], 'event': ['javascript', 'typescript'],
+        'ml': ['python'], 'stream': ['go', 'nodejs'], 'secure': ['rust', 'java'],
+        'mobile': ['java', 'typescript'], 'api': ['nodejs', 'python']
+    }
+    
     def __init__(self):
         self._engines = {}
         self._capabilities = {}
+        self._breakers = {}
+        self._base_scores = {}
+        self._shared_tables: Optional['SharedTables'] = None
         self._register_core_engines()
     
     def register_engine(self, name: str, engine_class: type, capabilities: EngineCapabilities):
         """Register new engine dynamically"""
         self._engines[name] = engine_class
         self._capabilities[name] = capabilities
-        logger.info(f"🔧 Registered engine: {name}")
+        self._breakers[name] = CircuitBreaker()
+        self._precompute_scores(name, capabilities)
+        if self._shared_tables is not None:
+            # Shared scores no longer describe this registry; use local tables
+            self._shared_tables = None
+        log_event('engine_registered', logging.DEBUG, "Registered engine: %s", name, engine=name)
     
     def get_engine(self, name: str) -> 'BaseEngine':
         """Get engine instance by name"""
@@ -71,42 +690,87 @@ class ILNEngineRegistry:
             return self._engines[name]()
         raise ValueError(f"Engine '{name}' not found. Available: {list(self._engines.keys())}")
     
+    def attach_shared(self, tables: 'SharedTables'):
+        """Read base scores from shared tables published by the parent process"""
+        self._shared_tables = tables
+    
+    def get_breaker(self, name: str) -> Optional[CircuitBreaker]:
+        """Circuit breaker guarding an engine"""
+        return self._breakers.get(name)
+    
+    def allow_engine(self, name: str) -> bool:
+        """True if the engine's circuit breaker admits a call (selection only, claims nothing)"""
+        breaker = self._breakers.get(name)
+        return breaker is None or breaker.allow_request()
+    
+    def select_engine(self, essences: Dict, priority: str, context: Dict) -> str:
+        """Best-scoring engine whose circuit breaker is not open"""
+        table = self._score_table()
+        mask = EssenceProcessor.essence_mask(essences)
+        engine_scores = {name: self._score(name, mask, priority, table)
+                         for name in self._engines if name != 'auto'}
+        ranked = sorted(engine_scores, key=lambda k: engine_scores[k], reverse=True)
+        for name in ranked:
+            if self.allow_engine(name):
+                return name
+        # Every breaker open: fall back to the best scorer rather than failing outright
+        return ranked[0]
+    
+    def get_breaker_metrics(self) -> Dict[str, Dict[str, Any]]:
+        return {name: breaker.get_metrics() for name, breaker in self._breakers.items()}
+    
     def calculate_engine_score(self, name: str, essences: Dict, priority: str, context: Dict) -> float:
         """Calculate engine fitness score"""
+        return self._score(name, EssenceProcessor.essence_mask(essences), priority, self._score_table())
+    
+    def _score_table(self) -> Dict[str, Dict[str, float]]:
+        """Base scores for this call: shared tables when attached, else the local precompute"""
+        if self._shared_tables is not None:
+            return self._shared_tables.score_table()
+        return self._base_scores
+    
+    def _score(self, name: str, mask: int, priority: str, table: Dict[str, Dict[str, float]]) -> float:
         if name not in self._capabilities:
             return 0.0
         
-        cap = self._capabilities[name]
-        base_score = 0.0
-        
-        # Priority-based scoring
-        priority_weights = {
-            'performance': {'performance_score': 0.5, 'safety_score': 0.1, 'reactivity_score': 0.2, 'ecosystem_score': 0.2},
-            'safety': {'performance_score': 0.2, 'safety_score': 0.5, 'reactivity_score': 0.1, 'ecosystem_score': 0.2},
-            'reactive': {'performance_score': 0.2, 'safety_score': 0.1, 'reactivity_score': 0.5, 'ecosystem_score': 0.2},
-            'balanced': {'performance_score': 0.25, 'safety_score': 0.25, 'reactivity_score': 0.25, 'ecosystem_score': 0.25}
-        }
-        
-        weights = priority_weights.get(priority, priority_weights['balanced'])
-        
-        base_score += cap.performance_score * weights['performance_score']
-        base_score += cap.safety_score * weights['safety_score']
-        base_score += cap.reactivity_score * weights['reactivity_score']
-        base_score += cap.ecosystem_score * weights['ecosystem_score']
+        # Priority-based scoring (precomputed at registration, or read from shared tables)
+        base_scores = table.get(name) or self._base_scores[name]
+        base_score = base_scores.get(priority, base_scores['balanced'])
         
-        # Essence-specific bonuses
-        essence_bonuses = {
-            'chan': ['go', 'rust'], 'own': ['rust', 'cpp'], 'event': ['javascript', 'typescript'],
-            'ml': ['python'], 'stream': ['go', 'nodejs'], 'secure': ['rust', 'java'],
-            'mobile': ['java', 'typescript'], 'api': ['nodejs', 'python']
-        }
-        
-        for essence in essences:
-            if essence in essence_bonuses and name in essence_bonuses[essence]:
-                base_score += 0.3
+        # Essence-specific bonuses: one per essence bit shared with the engine's bonus mask
+        base_score += 0.3 * bin(mask & self._BONUS_MASKS.get(name, 0)).count('1')
         
         return min(base_score, 1.0)
     
+    @classmethod
+    def add_essence_bonus(cls, essence: str, engines: List[str]):
+        """Favour `engines` for an essence; swaps in a new bonus table atomically"""
+        bonuses = {key: list(value) for key, value in cls.ESSENCE_BONUSES.items()}
+        bonuses[essence] = list(dict.fromkeys(bonuses.get(essence, []) + list(engines)))
+        cls.ESSENCE_BONUSES = bonuses
+        cls._rebuild_bonus_masks()
+    
+    @classmethod
+    def _rebuild_bonus_masks(cls):
+        """Engine name -> bitmask of essences granting it a bonus"""
+        masks = defaultdict(int)
+        for essence, engines in cls.ESSENCE_BONUSES.items():
+            for engine in engines:
+                masks[engine] |= 1 << EssenceProcessor.intern_essence(essence)
+        cls._BONUS_MASKS = dict(masks)
+    
+    def _precompute_scores(self, name: str, cap: EngineCapabilities):
+        """Per-priority base scores for one engine"""
+        base_scores = {}
+        for priority, weights in self.PRIORITY_WEIGHTS.items():
+            score = 0.0
+            score += cap.performance_score * weights['performance_score']
+            score += cap.safety_score * weights['safety_score']
+            score += cap.reactivity_score * weights['reactivity_score']
+            score += cap.ecosystem_score * weights['ecosystem_score']
+            base_scores[priority] = score
+        self._base_scores[name] = base_scores
+    
     def _register_core_engines(self):
         """Register core engines with capabilities"""
         
@@ -145,36 +809,356 @@ class ILNEngineRegistry:
             learning_curve=0.7, specialty_domains=['web_frontend', 'mobile']
         ))
 
+class ILNSectorRegistry:
+    """Level 4 sector handler registry - each sector is a callable(essences, context) -> Dict"""
+    
+    DEFAULT_SECTOR_TIMEOUT = 5.0
+    
+    def __init__(self):
+        self._handlers = {}
+        self._triggers = {}
+        self._timeouts = {}
+        self._register_core_sectors()
+    
+    def register_sector(self, name: str, handler: Callable[[Dict, Dict], Dict],
+                        trigger_essences: List[str] = None, timeout: Optional[float] = None):
+        """Register sector handler, activated by name or by any of its trigger essences"""
+        self._handlers[name] = handler
+        self._triggers[name] = list(trigger_essences or [])
+        self._timeouts[name] = timeout if timeout is not None else self.DEFAULT_SECTOR_TIMEOUT
+        log_event('sector_registered', logging.DEBUG, "Registered sector: %s", name, sector=name)
+    
+    def get_handler(self, name: str) -> Callable[[Dict, Dict], Dict]:
+        """Get sector handler by name"""
+        if name in self._handlers:
+            return self._handlers[name]
+        raise ValueError(f"Sector '{name}' not found. Available: {list(self._handlers.keys())}")
+    
+    def get_timeout(self, name: str) -> float:
+        """Get per-sector timeout in seconds"""
+        return self._timeouts.get(name, self.DEFAULT_SECTOR_TIMEOUT)
+    
+    def select_sectors(self, essences: Dict, requested: List[str]) -> List[str]:
+        """Sectors activated by requested names or matching essences, in registration order"""
+        return [
+            name for name in self._handlers
+            if name in requested or any(essence in essences for essence in self._triggers[name])
+        ]
+    
+    def _register_core_sectors(self):
+        """Register core sectors (mobile, cloud, ai, web)"""
+        self.register_sector('mobile', _mobile_sector, trigger_essences=['mobile'])
+        self.register_sector('cloud', _cloud_sector, trigger_essences=['api'])
+        self.register_sector('ai', _ai_sector, trigger_essences=['ml'])
+        self.register_sector('web', _web_sector, trigger_essences=['event'])
+
+def _mobile_sector(essences: Dict, context: Dict) -> Dict:
+    return {
+        'platform': 'cross_platform_development',
+        'frameworks': ['flutter', 'react_native', 'ionic'],
+        'deployment': 'local_build_process'
+    }
+
+def _cloud_sector(essences: Dict, context: Dict) -> Dict:
+    return {
+        'infrastructure': 'standard_cloud_services',
+        'deployment': 'conventional_deployment',
+        'scaling': 'manual_configuration'
+    }
+
+def _ai_sector(essences: Dict, context: Dict) -> Dict:
+    return {
+        'models': 'standard_ml_frameworks',
+        'training': 'local_training_process',
+        'inference': 'conventional_api_calls'
+    }
+
+def _web_sector(essences: Dict, context: Dict) -> Dict:
+    return {
+        'frontend': 'standard_spa_frameworks',
+        'backend': 'conventional_api_development',
+        'deployment': 'traditional_hosting'
+    }
+
+class ILNInputError(ValueError):
+    """Raised when code exceeds the essence parser's input limits"""
+    
+    def __init__(self, message: str, limit: str):
+        super().__init__(message)
+        self.limit = limit
+
+@dataclass(frozen=True)
+class ParseLimits:
+    """Bounds that keep essence parsing linear in the input length
+    
+    `max_label_length`, `max_args_length` and `max_whitespace` bound every quantifier
+    of the templated essence patterns, so each match attempt does constant work.
+    """
+    max_input_length: int = 65_536
+    max_essences: int = 10_000
+    max_label_length: int = 256
+    max_args_length: int = 1024
+    max_whitespace: int = 64
+
+class EssenceSet(dict):
+    """Parsed essences: name -> matches, plus interned IDs and a bitmask
+    
+    Behaves as the plain dict the public API always exposed; `ids` (aligned with
+    key order) and `mask` let the hot paths work on small integers instead of names.
+    """
+    
+    __slots__ = ('ids', 'mask')
+    
+    def __init__(self):
+        super().__init__()
+        self.ids: List[int] = []
+        self.mask = 0
+    
+    def add(self, essence_id: int, name: str, matches: List):
+        self[name] = matches
+        self.ids.append(essence_id)
+        self.mask |= 1 << essence_id
+
 class EssenceProcessor:
     """Enhanced essence processor with critical essences"""
     
-    ESSENCE_PATTERNS = {
-        # Original essences
-        'chan': r"chan!\s*\(\s*['\"]([^'\"]+)['\"],\s*([^)]+)\)",
-        'own': r"own!\s*\(\s*['\"]([^'\"]+)['\"],\s*([^)]+)\)",
-        'event': r"event!\s*\(\s*['\"]([^'\"]+)['\"],\s*([^)]+)\)",
-        'async': r"async!\s*\(\s*['\"]([^'\"]+)['\"],\s*([^)]+)\)",
-        'safe': r"safe!\s*\(\s*['\"]([^'\"]+)['\"],\s*([^)]+)\)",
-        'concurrent': r"concurrent!\s*\(\s*['\"]([^'\"]+)['\"],\s*([^)]+)\)",
-        'reactive': r"reactive!\s*\(\s*['\"]([^'\"]+)['\"],\s*([^)]+)\)",
-        
-        # Critical new essences
-        'ml': r"ml!\s*\(\s*['\"]([^'\"]+)['\"],\s*([^)]+)\)",
-        'stream': r"stream!\s*\(\s*['\"]([^'\"]+)['\"],\s*([^)]+)\)",
-        'secure': r"secure!\s*\(\s*['\"]([^'\"]+)['\"],\s*([^)]+)\)",
-        'mobile': r"mobile!\s*\(\s*['\"]([^'\"]+)['\"],\s*([^)]+)\)",
-        'api': r"api!\s*\(\s*['\"]([^'\"]+)['\"],\s*([^)]+)\)"
-    }
+    # Original essences, then critical new essences
+    BUILTIN_ESSENCES = ('chan', 'own', 'event', 'async', 'safe', 'concurrent', 'reactive',
+                        'ml', 'stream', 'secure', 'mobile', 'api')
+    
+    # Standard `name!('label', args)` form; every quantifier is bounded by ParseLimits
+    ESSENCE_TEMPLATE = (r"{keyword}!\s{{0,{ws}}}\(\s{{0,{ws}}}['\"]([^'\"]{{1,{label}}})['\"],"
+                        r"\s{{0,{ws}}}([^)]{{1,{args}}})\)")
+    
+    # A templated call running past a limit: padding, label or arguments one past the bound.
+    # The lookahead + back-reference makes the padding before the arguments atomic (no backtracking).
+    OVERFLOW_TEMPLATE = (r"{keyword}!(?:\s{{{ws1}}}\s*\(|\s{{0,{ws}}}\((?:\s{{{ws1}}}\s*['\"]|\s{{0,{ws}}}['\"]"
+                         r"(?:(?P<label>[^'\"]{{{label1}}})|[^'\"]{{1,{label}}}['\"],(?:\s{{{ws1}}}|"
+                         r"(?=(?P<pad>\s{{0,{ws}}}))(?P=pad)(?P<args>[^)]{{{args1}}})))))")
+    
+    ESSENCE_PATTERNS: Dict[str, str] = {}
+    PARSE_LIMITS = ParseLimits()
+    _templated = set()  # essences whose pattern is rendered from ESSENCE_TEMPLATE
+    
+    _registry_lock = threading.Lock()
+    _matcher: '_EssenceMatcher' = None
+    
+    # Stable small integer IDs, assigned in registration order
+    ESSENCE_IDS: Dict[str, int] = {}
+    ESSENCE_NAMES: List[str] = []
+    _intern_lock = threading.Lock()  # separate from _registry_lock, which is held while interning
+    
+    @classmethod
+    def intern_essence(cls, name: str) -> int:
+        """Stable integer ID for an essence name (assigned on first sight)"""
+        essence_id = cls.ESSENCE_IDS.get(name)
+        if essence_id is None:
+            with cls._intern_lock:
+                essence_id = cls.ESSENCE_IDS.get(name)
+                if essence_id is None:
+                    essence_id = len(cls.ESSENCE_NAMES)
+                    cls.ESSENCE_NAMES.append(name)
+                    cls.ESSENCE_IDS[name] = essence_id
+        return essence_id
+    
+    @classmethod
+    def mask_of(cls, names) -> int:
+        """Bitmask for a collection of essence names"""
+        mask = 0
+        for name in names:
+            mask |= 1 << cls.intern_essence(name)
+        return mask
+    
+    @classmethod
+    def essence_mask(cls, essences: Dict) -> int:
+        """Bitmask of a parsed essence mapping (free for EssenceSet)"""
+        mask = getattr(essences, 'mask', None)
+        if mask is None:
+            mask = 0
+            for name in essences:
+                essence_id = cls.ESSENCE_IDS.get(name)
+                if essence_id is not None:
+                    mask |= 1 << essence_id
+        return mask
+    
+    @classmethod
+    def essence_ids(cls, essences: Dict) -> List[int]:
+        """Interned IDs aligned with the mapping's key order"""
+        ids = getattr(essences, 'ids', None)
+        if ids is None:
+            ids = [cls.intern_essence(name) for name in essences]
+        return ids
+    
+    @classmethod
+    def register_essence(cls, name: str, pattern: Optional[str] = None,
+                         bonus_engines: List[str] = None) -> int:
+        """Register (or redefine) an essence; returns the new matcher version
+        
+        `pattern` defaults to the standard `name!('label', args)` form, whose
+        over-limit calls are rejected. Custom patterns should use only bounded
+        quantifiers, or the linear-time guarantee no longer holds. The compiled
+        matcher is rebuilt once and swapped in; parses already running keep the
+        snapshot they started with.
+        """
+        name = name.lower()
+        with cls._registry_lock:
+            patterns = dict(cls.ESSENCE_PATTERNS)
+            templated = set(cls._templated)
+            if pattern:
+                templated.discard(name)
+                patterns[name] = pattern
+            else:
+                templated.add(name)
+                patterns[name] = cls._render_pattern(name, cls.PARSE_LIMITS)
+            matcher = cls._build_matcher(cls._matcher.version + 1, patterns, templated, cls.PARSE_LIMITS)
+            cls.ESSENCE_PATTERNS = patterns
+            cls._templated = templated
+            cls._matcher = matcher
+            if bonus_engines:
+                ILNEngineRegistry.add_essence_bonus(name, bonus_engines)
+        log_event('essence_registered', logging.INFO, "Registered essence: %s (matcher v%d)",
+                  name, matcher.version, essence=name, matcher_version=matcher.version)
+        return matcher.version
+    
+    @classmethod
+    def set_parse_limits(cls, limits: ParseLimits) -> int:
+        """Swap in new parser limits, re-rendering templated patterns; returns the matcher version"""
+        with cls._registry_lock:
+            patterns = dict(cls.ESSENCE_PATTERNS)
+            for name in cls._templated:
+                patterns[name] = cls._render_pattern(name, limits)
+            version = cls._matcher.version + 1 if cls._matcher is not None else 1
+            matcher = cls._build_matcher(version, patterns, cls._templated, limits)
+            cls.ESSENCE_PATTERNS = patterns
+            cls.PARSE_LIMITS = limits
+            cls._matcher = matcher
+        return matcher.version
+    
+    @classmethod
+    def _render_pattern(cls, name: str, limits: ParseLimits, template: str = None) -> str:
+        return (template or cls.ESSENCE_TEMPLATE).format(
+            keyword=re.escape(name), ws=limits.max_whitespace, ws1=limits.max_whitespace + 1,
+            label=limits.max_label_length, label1=limits.max_label_length + 1,
+            args=limits.max_args_length, args1=limits.max_args_length + 1
+        )
+    
+    @classmethod
+    def _build_matcher(cls, version: int, patterns: Dict[str, str], templated: set,
+                       limits: ParseLimits) -> '_EssenceMatcher':
+        overflows = {name: cls._render_pattern(name, limits, cls.OVERFLOW_TEMPLATE)
+                     for name in patterns if name in templated}
+        return _EssenceMatcher(version, patterns, limits, overflows)
+    
+    @classmethod
+    def check_input(cls, code: str):
+        """Cheap O(1) size check ahead of hashing, queuing and parsing"""
+        limit = cls.PARSE_LIMITS.max_input_length
+        if len(code) > limit:
+            raise ILNInputError(f"Input of {len(code)} characters exceeds the {limit} character limit",
+                                'max_input_length')
+    
+    @classmethod
+    def matcher_version(cls) -> int:
+        return cls._matcher.version
+    
+    @classmethod
+    def matcher_digest(cls) -> bytes:
+        return cls._matcher.digest
     
     @classmethod
     def parse_essences(cls, code: str) -> Dict[str, List]:
         """Parse ILN essence syntax from code"""
-        essences = {}
-        for essence_name, pattern in cls.ESSENCE_PATTERNS.items():
-            matches = re.findall(pattern, code, re.IGNORECASE)
+        return cls._matcher.parse(code)
+
+class _EssenceMatcher:
+    """Immutable, versioned set of compiled essence patterns
+    
+    Each essence keeps its own compiled regex and plain findall semantics; the
+    set is rebuilt once per registration or limits change and swapped in whole.
+    Templated essences also carry an overflow regex, so a call exceeding the
+    limits is rejected instead of silently not matching.
+    """
+    
+    def __init__(self, version: int, patterns: Dict[str, str], limits: ParseLimits,
+                 overflows: Dict[str, str] = None):
+        self.version = version
+        self.limits = limits
+        # Identifies the pattern set across processes, unlike the per-process version counter
+        self.digest = hashlib.blake2b(json.dumps([list(patterns.items()), asdict(limits)]).encode('utf-8'),
+                                      digest_size=16).digest()
+        overflows = overflows or {}
+        self.essences = [(name, EssenceProcessor.intern_essence(name), re.compile(pattern, re.IGNORECASE),
+                          re.compile(overflows[name], re.IGNORECASE) if name in overflows else None)
+                         for name, pattern in patterns.items()]
+    
+    def parse(self, code: str) -> EssenceSet:
+        limits = self.limits
+        if len(code) > limits.max_input_length:
+            raise ILNInputError(f"Input of {len(code)} characters exceeds the {limits.max_input_length} "
+                                f"character limit", 'max_input_length')
+        essences = EssenceSet()
+        remaining = limits.max_essences
+        may_overflow = self._may_overflow(code)
+        for name, essence_id, regex, overflow in self.essences:
+            hit = overflow.search(code) if may_overflow and overflow is not None else None
+            if hit is not None:
+                matches = self._checked_matches(name, regex, overflow, code, hit)
+            else:
+                matches = regex.findall(code)
             if matches:
-                essences[essence_name] = matches
+                remaining -= len(matches)
+                if remaining < 0:
+                    raise ILNInputError(f"Input declares more than {limits.max_essences} essences",
+                                        'max_essences')
+                essences.add(essence_id, name, matches)
         return essences
+    
+    def _may_overflow(self, code: str) -> bool:
+        """Cheap C-speed prefilter: any run long enough to exceed a limit at all?"""
+        limits = self.limits
+        if len(code) <= limits.max_whitespace:
+            return False
+        return (max(map(len, code.split(')'))) > limits.max_args_length
+                or max(map(len, code.replace('"', "'").split("'"))) > limits.max_label_length
+                or re.search(r"\s{%d}" % (limits.max_whitespace + 1), code) is not None)
+    
+    def _checked_matches(self, name: str, regex, overflow, code: str, hit) -> List:
+        """findall results, raising for an over-limit call not nested inside a match (rare path)
+        
+        Hits are decided in order, scanning matches only up to each hit (plus the
+        longest possible match), so a hostile input is rejected at its first
+        offending call without matching the rest. A hit at a match's own start is
+        over-limit padding the bounded pattern absorbed into the arguments, so it
+        is rejected too.
+        """
+        limits = self.limits
+        # No match is longer than this, so one containing a hit ends within `window` of it
+        window = len(name) + 3 * limits.max_whitespace + limits.max_label_length + limits.max_args_length + 6
+        cursor = 0
+        match = None
+        for hit in itertools.chain((hit,), overflow.finditer(code, hit.end())):
+            position = hit.start()
+            while match is None or match.end() <= position:
+                match = regex.search(code, cursor, position + window)
+                if match is None or match.start() >= position:
+                    match = None  # a truncated search only speaks for matches starting before the hit
+                    break
+                cursor = match.end()
+            if match is not None and match.start() < position:
+                continue
+            if hit.group('label') is not None:
+                limit, value = 'max_label_length', limits.max_label_length
+            elif hit.group('args') is not None:
+                limit, value = 'max_args_length', limits.max_args_length
+            else:
+                limit, value = 'max_whitespace', limits.max_whitespace
+            raise ILNInputError(f"Essence '{name}' at offset {position} exceeds {limit} ({value})", limit)
+        return regex.findall(code)
+
+EssenceProcessor._templated = set(EssenceProcessor.BUILTIN_ESSENCES)
+EssenceProcessor.ESSENCE_PATTERNS = {name: None for name in EssenceProcessor.BUILTIN_ESSENCES}
+EssenceProcessor.set_parse_limits(ParseLimits())
+ILNEngineRegistry._rebuild_bonus_masks()
 
 class ChampionSelector:
     """Level 3 Champion Selection Logic"""
@@ -205,39 +1189,278 @@ class ChampionSelector:
         strategy_key = cls._determine_strategy(context, essences)
         strategy = cls.CHAMPION_STRATEGIES.get(strategy_key, cls.CHAMPION_STRATEGIES['enterprise'])
         
-        champion_scores = {}
-        for champion in strategy['primary_champions']:
-            if champion != base_language and champion in registry._engines:
-                score = registry.calculate_engine_score(champion, essences, 
-                                                      context.get('priority', 'balanced'), context)
-                score += 0.3  # Primary champion bonus
-                champion_scores[champion] = score
-        
-        if champion_scores:
-            best_champion = max(champion_scores.keys(), key=lambda k: champion_scores[k])
-            logger.info(f"🏆 Selected champion: {best_champion} (strategy: {strategy_key})")
-            return best_champion
+        # Primary champions first, secondary champions as fallback when breakers are open
+        for tier, bonus in (('primary_champions', 0.3), ('secondary_champions', 0.0)):
+            champion_scores = {}
+            for champion in strategy[tier]:
+                if champion != base_language and champion in registry._engines:
+                    score = registry.calculate_engine_score(champion, essences, 
+                                                          context.get('priority', 'balanced'), context)
+                    champion_scores[champion] = score + bonus
+            
+            for champion in sorted(champion_scores, key=lambda k: champion_scores[k], reverse=True):
+                if registry.allow_engine(champion):
+                    log_event('champion_selected', logging.DEBUG, "Selected champion: %s (strategy: %s)",
+                              champion, strategy_key, champion=champion, strategy=strategy_key)
+                    return champion
         
         return 'go'  # Default champion
     
+    SAFETY_MASK = EssenceProcessor.mask_of(['secure', 'own'])
+    PERFORMANCE_MASK = EssenceProcessor.mask_of(['chan', 'concurrent'])
+    
     @classmethod
     def _determine_strategy(cls, context: Dict, essences: Dict) -> str:
         """Determine champion strategy"""
         domain = context.get('domain', '')
+        mask = EssenceProcessor.essence_mask(essences)
         if domain in ['web', 'frontend']:
             return 'web_focused'
         elif domain in ['enterprise', 'business']:
             return 'enterprise'
-        elif 'secure' in essences or 'own' in essences:
+        elif mask & cls.SAFETY_MASK:
             return 'safety_critical'
-        elif 'chan' in essences or 'concurrent' in essences:
+        elif mask & cls.PERFORMANCE_MASK:
             return 'performance_critical'
         return 'enterprise'
 
+class SharedTables:
+    """Score tables and a parse cache in shared memory, built once and read by forked workers
+    
+    Backed by `multiprocessing.shared_memory` (attach by `name`) or by an mmap'd
+    file (`path`). The parent publishes a registry's precomputed base scores,
+    then forks; children read them zero-copy through a memoryview. The parse
+    cache is a fixed array of slots guarded by a sequence counter and CRC, so a
+    torn or concurrent write simply reads as a miss.
+    
+    Invalidation: ILN.register_essence bumps the parse generation (stale slots
+    become misses); registering an engine on an attached registry detaches that
+    registry from the shared scores, and `publish_registry` bumps the score
+    generation for everyone.
+    """
+    
+    MAGIC = b'ILNS'
+    LAYOUT_VERSION = 1
+    HEADER = struct.Struct('<4sIQQIII')  # magic, layout, score gen, parse gen, max engines, slots, slot size
+    HEADER_SIZE = 64
+    NAME_SIZE = 32
+    SLOT_HEADER = struct.Struct('<IQ16sII')  # seq, parse gen, key digest, length, crc32
+    PRIORITIES = list(ILNEngineRegistry.PRIORITY_WEIGHTS.keys())
+    _created = set()  # block names created by this process, or by its parent before fork
+    
+    def __init__(self, buffer, handle, max_engines: int, cache_slots: int, slot_size: int):
+        self._buffer = buffer
+        self._handle = handle
+        self.max_engines = max_engines
+        self.cache_slots = cache_slots
+        self.slot_size = slot_size
+        
+        names_offset = self.HEADER_SIZE
+        scores_offset = names_offset + max_engines * self.NAME_SIZE
+        self._cache_offset = scores_offset + max_engines * len(self.PRIORITIES) * 8
+        view = memoryview(buffer)
+        self._names = view[names_offset:scores_offset]
+        self._scores = view[scores_offset:self._cache_offset].cast('d')
+        self._table_generation = -1
+        self._score_table: Dict[str, Dict[str, float]] = {}
+        self._write_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+    
+    @classmethod
+    def _size(cls, max_engines: int, cache_slots: int, slot_size: int) -> int:
+        return (cls.HEADER_SIZE + max_engines * cls.NAME_SIZE
+                + max_engines * len(cls.PRIORITIES) * 8 + cache_slots * slot_size)
+    
+    @classmethod
+    def create(cls, path: Optional[str] = None, max_engines: int = 64, cache_slots: int = 4096,
+               slot_size: int = 1024) -> 'SharedTables':
+        """Allocate zeroed tables (file-backed when `path` is given)"""
+        size = cls._size(max_engines, cache_slots, slot_size)
+        if path is not None:
+            with open(path, 'wb') as f:
+                f.truncate(size)
+            with open(path, 'r+b') as f:
+                buffer = mmap.mmap(f.fileno(), size)
+            handle = None
+        else:
+            handle = shared_memory.SharedMemory(create=True, size=size)
+            cls._created.add(handle.name)
+            buffer = handle.buf
+        cls.HEADER.pack_into(buffer, 0, cls.MAGIC, cls.LAYOUT_VERSION, 0, 0, max_engines, cache_slots, slot_size)
+        return cls(buffer, handle, max_engines, cache_slots, slot_size)
+    
+    @classmethod
+    def attach(cls, name: Optional[str] = None, path: Optional[str] = None) -> 'SharedTables':
+        """Attach to tables created by another process (not needed after fork)"""
+        if path is not None:
+            with open(path, 'r+b') as f:
+                buffer = mmap.mmap(f.fileno(), 0)
+            handle = None
+        else:
+            handle = cls._attach_block(name)
+            buffer = handle.buf
+        magic, layout, _, _, max_engines, cache_slots, slot_size = cls.HEADER.unpack_from(buffer, 0)
+        if magic != cls.MAGIC or layout != cls.LAYOUT_VERSION:
+            raise ValueError("Not an ILN shared table region (or incompatible layout)")
+        return cls(buffer, handle, max_engines, cache_slots, slot_size)
+    
+    @classmethod
+    def _attach_block(cls, name: str) -> shared_memory.SharedMemory:
+        """Open an existing block without letting this process' resource tracker unlink it at exit
+        
+        Blocks created here (or by a parent before fork) share the creator's tracker
+        registration, which is left alone.
+        """
+        if sys.version_info >= (3, 13):
+            return shared_memory.SharedMemory(name=name, track=name in cls._created)
+        handle = shared_memory.SharedMemory(name=name)
+        if os.name == 'posix' and name not in cls._created:
+            resource_tracker.unregister(handle._name, 'shared_memory')
+        return handle
+    
+    @property
+    def name(self) -> Optional[str]:
+        return self._handle.name if self._handle is not None else None
+    
+    def _generations(self) -> tuple:
+        return self.HEADER.unpack_from(self._buffer, 0)[2:4]
+    
+    def _bump(self, score: bool = False, parse: bool = False):
+        with self._write_lock:
+            header = list(self.HEADER.unpack_from(self._buffer, 0))
+            header[2] += int(score)
+            header[3] += int(parse)
+            self.HEADER.pack_into(self._buffer, 0, *header)
+    
+    # --- Score tables ---
+    
+    def publish_registry(self, registry: 'ILNEngineRegistry'):
+        """Write a registry's precomputed base scores (parent, before forking)"""
+        engines = [name for name in registry._base_scores if len(name.encode('utf-8')) <= self.NAME_SIZE]
+        engines = engines[:self.max_engines]
+        with self._write_lock:
+            self._names[:] = bytes(len(self._names))
+            for index, name in enumerate(engines):
+                encoded = name.encode('utf-8')
+                start = index * self.NAME_SIZE
+                self._names[start:start + len(encoded)] = encoded
+                for offset, priority in enumerate(self.PRIORITIES):
+                    self._scores[index * len(self.PRIORITIES) + offset] = registry._base_scores[name][priority]
+        self._bump(score=True)
+        registry.attach_shared(self)
+    
+    def score_table(self) -> Dict[str, Dict[str, float]]:
+        """Published base scores (engine -> priority -> score), re-read only when the generation moves
+        
+        One header read per call: fetch the table once per selection, not per engine.
+        """
+        generation = self._generations()[0]
+        if generation != self._table_generation:
+            self._rebuild_table(generation)
+        return self._score_table
+    
+    def base_score(self, name: str, priority: str) -> Optional[float]:
+        """Shared base score, or None if the engine is not published"""
+        scores = self.score_table().get(name)
+        if scores is None:
+            return None
+        return scores.get(priority, scores['balanced'])
+    
+    def _rebuild_table(self, generation: int):
+        table = {}
+        width = len(self.PRIORITIES)
+        for position in range(self.max_engines):
+            raw = bytes(self._names[position * self.NAME_SIZE:(position + 1) * self.NAME_SIZE]).rstrip(b'\0')
+            if raw:
+                table[raw.decode('utf-8')] = dict(zip(self.PRIORITIES,
+                                                      self._scores[position * width:(position + 1) * width]))
+        self._score_table = table
+        self._table_generation = generation
+    
+    # --- Parse cache ---
+    
+    def invalidate_parses(self):
+        """Make every cached parse stale (essence registry changed)"""
+        self._bump(parse=True)
+    
+    def _slot(self, code: str) -> tuple:
+        key = EssenceProcessor.matcher_digest() + code.encode('utf-8', 'surrogatepass')
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        slot = int.from_bytes(digest[:8], 'little') % self.cache_slots
+        return self._cache_offset + slot * self.slot_size, digest
+    
+    def get_parse(self, code: str) -> Optional[EssenceSet]:
+        offset, digest = self._slot(code)
+        seq, generation, key, length, crc = self.SLOT_HEADER.unpack_from(self._buffer, offset)
+        payload_start = offset + self.SLOT_HEADER.size
+        if (seq % 2 or key != digest or generation != self._generations()[1]
+                or length > self.slot_size - self.SLOT_HEADER.size):
+            self._misses += 1
+            return None
+        payload = bytes(self._buffer[payload_start:payload_start + length])
+        if zlib.crc32(payload) != crc or self.SLOT_HEADER.unpack_from(self._buffer, offset)[0] != seq:
+            self._misses += 1
+            return None
+        
+        essences = EssenceSet()
+        for name, matches in json.loads(payload):
+            essences.add(EssenceProcessor.intern_essence(name), name,
+                         [tuple(match) if isinstance(match, list) else match for match in matches])
+        self._hits += 1
+        return essences
+    
+    def put_parse(self, code: str, essences: Dict):
+        payload = json.dumps([[name, matches] for name, matches in essences.items()]).encode('utf-8')
+        if len(payload) > self.slot_size - self.SLOT_HEADER.size:
+            return  # too large to share; callers keep the local parse
+        offset, digest = self._slot(code)
+        with self._write_lock:
+            seq = self.SLOT_HEADER.unpack_from(self._buffer, offset)[0]
+            # Odd sequence marks the slot as being written
+            struct.pack_into('<I', self._buffer, offset, (seq + 1) | 1)
+            payload_start = offset + self.SLOT_HEADER.size
+            self._buffer[payload_start:payload_start + len(payload)] = payload
+            self.SLOT_HEADER.pack_into(self._buffer, offset, ((seq + 1) | 1) + 1, self._generations()[1],
+                                       digest, len(payload), zlib.crc32(payload))
+    
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self._hits + self._misses
+        score_generation, parse_generation = self._generations()
+        return {
+            'backend': 'shared_memory' if self._handle is not None else 'mmap',
+            'name': self.name,
+            'score_generation': score_generation,
+            'parse_generation': parse_generation,
+            'parse_hits': self._hits,
+            'parse_misses': self._misses,
+            'parse_hit_rate': self._hits / lookups if lookups else 0.0
+        }
+    
+    def close(self):
+        """Release this process' mapping"""
+        self._names.release()
+        self._scores.release()
+        if self._handle is not None:
+            self._handle.close()
+        else:
+            self._buffer.close()
+    
+    def unlink(self):
+        """Destroy the shared memory block (creator, after workers exit)"""
+        if self._handle is not None:
+            self._handle.unlink()
+
 class ILN:
     """🌌 ILN v2.0 - Enhanced Language Unification System"""
     
-    def __init__(self, api_key: Optional[str] = None, pro_endpoint: str = "https://api.iln-nexus.com"):
+    SECTOR_START_POLL = 0.01  # seconds between checks for queued sectors starting to run
+    
+    def __init__(self, api_key: Optional[str] = None, pro_endpoint: str = "https://api.iln-nexus.com",
+                 sector_workers: int = 8, admission: Optional[AdmissionController] = None,
+                 single_flight: Optional['SingleFlight'] = None,
+                 result_cache: Optional[ResultCache] = None,
+                 shared_tables: Optional[SharedTables] = None):
         self.version = __version__
         self.api_key = api_key
         self.pro_endpoint = pro_endpoint
@@ -245,18 +1468,37 @@ class ILN:
         
         # Initialize modular components
         self.engine_registry = ILNEngineRegistry()
+        self.sector_registry = ILNSectorRegistry()
         self.essence_processor = EssenceProcessor()
         self.champion_selector = ChampionSelector()
+        self.admission = admission
+        self.single_flight = single_flight
+        self.result_cache = result_cache
+        self.shared_tables = shared_tables
+        if shared_tables is not None:
+            self.engine_registry.attach_shared(shared_tables)
         
-        logger.info(f"🌌 ILN v{self.version} initialized with {len(self.engine_registry._engines)} engines")
-        if self.has_pro:
-            logger.info("🔥 Pro features available (Levels 3-4)")
-        else:
-            logger.info("🆓 Community edition (Levels 1-2)")
+        # Level 4 sector fan-out pool (created on first use)
+        self.sector_workers = sector_workers
+        self._sector_executor = None
+        self._sector_executor_lock = threading.Lock()
+        self._stranded_sectors = 0  # timed-out handlers still holding a pool thread
+        
+        log_event('iln_initialized', logging.DEBUG, "ILN v%s initialized with %d engines (%s)",
+                  self.version, len(self.engine_registry._engines),
+                  "Pro: Levels 1-4" if self.has_pro else "Community: Levels 1-2",
+                  version=self.version, engines=len(self.engine_registry._engines), has_pro=self.has_pro)
     
     def execute(self, iln_code: str, level: int = 1, engine: str = "auto", 
-                context: Dict = None, **kwargs) -> ILNResult:
-        """Enhanced execution with Level 3-4 support"""
+                context: Dict = None, timeout: Optional[float] = None,
+                deadline: Optional[float] = None, cancel_token: CancellationToken = None,
+                bypass_cache: bool = False, **kwargs) -> ILNResult:
+        """Enhanced execution with Level 3-4 support
+        
+        `timeout` is a budget in seconds, `deadline` an absolute time.monotonic() value;
+        when exceeded, a partial result with a timeout error is returned.
+        `bypass_cache` skips the engine result cache and single-flight coalescing for this call.
+        """
         
         if level in [3, 4] and not self.has_pro:
             return ILNResult(
@@ -265,46 +1507,149 @@ class ILN:
                 error=f"Level {level} requires ILN Pro. Contact: nexusstudio100@gmail.com"
             )
         
+        # Non-string input skips the pre-check and coalescing; the pipeline reports it as a failure
+        is_text = isinstance(iln_code, str)
+        if is_text:
+            try:
+                EssenceProcessor.check_input(iln_code)
+            except ILNInputError as e:
+                return self._input_rejected_result(e, level, engine)
+        
         start_time = time.time()
         context = context or {}
         
+        token = cancel_token or CancellationToken()
+        token.tighten(deadline)
+        if timeout is not None:
+            token.tighten(time.monotonic() + timeout)
+        
+        # A cache bypass asks for a fresh computation: never reuse a coalesced result
+        if self.single_flight is None or bypass_cache or not is_text:
+            return self._execute_guarded(iln_code, level, engine, context, token, start_time,
+                                         bypass_cache=bypass_cache, **kwargs)
+        
+        # Identical concurrent requests share the leader's computation
+        key = SingleFlight.make_key(iln_code, level, engine, context, kwargs)
+        result = self.single_flight.do(
+            key, lambda: self._execute_guarded(iln_code, level, engine, context, token, start_time,
+                                               bypass_cache=bypass_cache, **kwargs),
+            timeout=token.remaining()
+        )
+        if result is None:
+            return ILNResult(
+                success=False, level=level, result=None, execution_time=time.time() - start_time,
+                essences_used=[], engine=engine, error="Deadline exceeded while waiting for coalesced execution",
+                metadata={'error_type': 'timeout', 'timed_out': True, 'stage': 'coalesce'}
+            )
+        return result
+    
+    async def execute_async(self, iln_code: str, level: int = 1, engine: str = "auto",
+                            context: Dict = None, **kwargs) -> ILNResult:
+        """Asyncio entry point - runs execute() in the loop's executor without blocking the loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.execute, iln_code, level, engine, context, **kwargs)
+        )
+    
+    def _execute_guarded(self, iln_code: str, level: int, engine: str, context: Dict,
+                         token: CancellationToken, start_time: float, **kwargs) -> ILNResult:
+        """Apply level admission control around the pipeline"""
+        if self.admission is None:
+            return self._execute_admitted(iln_code, level, engine, context, token, start_time, **kwargs)
+        
         try:
-            if level == 1:
-                result = self._execute_level1(iln_code, engine, context)
-            elif level == 2:
-                result = self._execute_level2(iln_code, engine, context, **kwargs)
-            elif level == 3:
-                result = self._execute_level3(iln_code, engine, context, **kwargs)
-            elif level == 4:
-                result = self._execute_level4_basic(iln_code, engine, context, **kwargs)
-            else:
-                raise ValueError(f"Invalid level: {level}. Supported: 1-4")
+            self.admission.acquire_level(level, token.remaining())
+        except ILNAdmissionError as e:
+            return self._rejected_result(e, level, engine)
+        try:
+            return self._execute_admitted(iln_code, level, engine, context, token, start_time, **kwargs)
+        finally:
+            self.admission.release_level(level)
+    
+    def _execute_admitted(self, iln_code: str, level: int, engine: str, context: Dict,
+                          token: CancellationToken, start_time: float, bypass_cache: bool = False,
+                          **kwargs) -> ILNResult:
+        """Run the level pipeline, mapping timeouts and failures to ILNResult"""
+        try:
+            with PROFILER.stage(f"execute:level{level}"):
+                if level == 1:
+                    result = self._execute_level1(iln_code, engine, context, token=token,
+                                                  bypass_cache=bypass_cache)
+                elif level == 2:
+                    result = self._execute_level2(iln_code, engine, context, token=token,
+                                                  bypass_cache=bypass_cache, **kwargs)
+                elif level == 3:
+                    result = self._execute_level3(iln_code, engine, context, token=token,
+                                                  bypass_cache=bypass_cache, **kwargs)
+                elif level == 4:
+                    result = self._execute_level4_basic(iln_code, engine, context, token=token, **kwargs)
+                else:
+                    raise ValueError(f"Invalid level: {level}. Supported: 1-4")
             
             return result
-                
-        except Exception as e:
+        
+        except ILNTimeoutError as e:
             execution_time = time.time() - start_time
-            logger.error(f"Execution error: {str(e)}")
+            log_event('execution_timeout', logging.WARNING, "Execution timeout: %s", e,
+                      level=level, stage=e.stage)
             return ILNResult(
                 success=False, level=level, result=None, execution_time=execution_time,
-                essences_used=[], engine=engine, error=str(e)
+                essences_used=list(token.partial.get('essences', {}).keys()),
+                engine=token.partial.get('engine', engine), error=str(e),
+                metadata={'error_type': 'timeout', 'timed_out': True, 'stage': e.stage}
             )
-    
-    def _execute_level1(self, code: str, engine: str, context: Dict) -> ILNResult:
-        """Level 1: Basic Essence Absorption"""
+        
+        except ILNAdmissionError as e:
+            return self._rejected_result(e, level, engine)
+        
+        except ILNInputError as e:
+            log_event('input_rejected', logging.WARNING, "Input rejected: %s", e,
+                      level=level, limit=e.limit)
+            return self._input_rejected_result(e, level, engine)
+                
+        except Exception as e:
+            execution_time = time.time() - start_time
+            log_event('execution_error', logging.ERROR, "Execution error: %s", e,
+                      level=level, engine=engine, error_class=type(e).__name__)
+            return ILNResult(
+                success=False, level=level, result=None, execution_time=execution_time,
+                essences_used=[], engine=engine, error=str(e)
+            )
+    
+    def _rejected_result(self, error: ILNAdmissionError, level: int, engine: str) -> ILNResult:
+        """Typed fast-rejection result for saturated admission scopes"""
+        return ILNResult(
+            success=False, level=level, result=None, execution_time=0,
+            essences_used=[], engine=engine, error=str(error),
+            metadata={'error_type': 'admission_rejected', 'scope': error.scope}
+        )
+    
+    def _input_rejected_result(self, error: ILNInputError, level: int, engine: str) -> ILNResult:
+        """Typed rejection result for code over the parser limits"""
+        return ILNResult(
+            success=False, level=level, result=None, execution_time=0,
+            essences_used=[], engine=engine, error=str(error),
+            metadata={'error_type': 'input_rejected', 'limit': error.limit}
+        )
+    
+    def _execute_level1(self, code: str, engine: str, context: Dict,
+                        token: CancellationToken = None, bypass_cache: bool = False) -> ILNResult:
+        """Level 1: Basic Essence Absorption"""
         start_time = time.time()
-        essences = self.essence_processor.parse_essences(code)
+        token = token or CancellationToken()
+        essences = self._parse_stage(code, token)
         
+        token.check('select')
         if engine == "auto":
-            engine_scores = {name: self.engine_registry.calculate_engine_score(
-                name, essences, context.get('priority', 'balanced'), context
-            ) for name in self.engine_registry._engines if name != 'auto'}
-            selected_engine_name = max(engine_scores.keys(), key=lambda k: engine_scores[k])
+            with PROFILER.stage('score'):
+                selected_engine_name = self.engine_registry.select_engine(
+                    essences, context.get('priority', 'balanced'), context
+                )
         else:
             selected_engine_name = engine
         
-        selected_engine = self.engine_registry.get_engine(selected_engine_name)
-        result = selected_engine.execute_level1(essences, context)
+        result = self._run_engine(selected_engine_name, token, 1, 'execute_level1',
+                                  (essences, context), bypass_cache=bypass_cache, code=code)
         execution_time = time.time() - start_time
         
         return ILNResult(
@@ -313,22 +1658,23 @@ class ILN:
             metadata={'method': 'essence_absorption', 'paradigms_unified': len(essences)}
         )
     
-    def _execute_level2(self, code: str, engine: str, context: Dict, **kwargs) -> ILNResult:
+    def _execute_level2(self, code: str, engine: str, context: Dict,
+                        token: CancellationToken = None, bypass_cache: bool = False, **kwargs) -> ILNResult:
         """Level 2: Multi-Engine Architecture"""
         start_time = time.time()
-        essences = self.essence_processor.parse_essences(code)
+        token = token or CancellationToken()
+        essences = self._parse_stage(code, token)
         priority = kwargs.get('priority', 'balanced')
         
+        token.check('select')
         if engine == "auto":
-            engine_scores = {name: self.engine_registry.calculate_engine_score(
-                name, essences, priority, context
-            ) for name in self.engine_registry._engines if name != 'auto'}
-            selected_engine_name = max(engine_scores.keys(), key=lambda k: engine_scores[k])
+            with PROFILER.stage('score'):
+                selected_engine_name = self.engine_registry.select_engine(essences, priority, context)
         else:
             selected_engine_name = engine
         
-        selected_engine = self.engine_registry.get_engine(selected_engine_name)
-        result = selected_engine.execute_level2(essences, context, **kwargs)
+        result = self._run_engine(selected_engine_name, token, 2, 'execute_level2',
+                                  (essences, context), kwargs, bypass_cache=bypass_cache, code=code)
         execution_time = time.time() - start_time
         
         return ILNResult(
@@ -337,22 +1683,27 @@ class ILN:
             metadata={'method': 'multi_engine_coordination', 'optimization': priority}
         )
     
-    def _execute_level3(self, code: str, engine: str, context: Dict, **kwargs) -> ILNResult:
+    def _execute_level3(self, code: str, engine: str, context: Dict,
+                        token: CancellationToken = None, bypass_cache: bool = False, **kwargs) -> ILNResult:
         """Level 3: Champion Cascade Strategy"""
         start_time = time.time()
-        essences = self.essence_processor.parse_essences(code)
+        token = token or CancellationToken()
+        essences = self._parse_stage(code, token)
         base_language = context.get('base_language', 'python')
         
+        token.check('select')
         champion_request = kwargs.get('champion', 'auto')
         if champion_request == 'auto':
-            selected_champion = self.champion_selector.select_champion(
-                base_language, context, essences, self.engine_registry
-            )
+            with PROFILER.stage('champion'):
+                selected_champion = self.champion_selector.select_champion(
+                    base_language, context, essences, self.engine_registry
+                )
         else:
             selected_champion = champion_request
         
-        champion_engine = self.engine_registry.get_engine(selected_champion)
-        result = champion_engine.execute_level3(essences, context, base_language, **kwargs)
+        result = self._run_engine(selected_champion, token, 3, 'execute_level3',
+                                  (essences, context, base_language), kwargs, bypass_cache=bypass_cache,
+                                  code=code)
         execution_time = time.time() - start_time
         
         return ILNResult(
@@ -361,58 +1712,240 @@ class ILN:
             metadata={'method': 'champion_cascade', 'champion': selected_champion}
         )
     
-    def _execute_level4_basic(self, code: str, engine: str, context: Dict, **kwargs) -> ILNResult:
+    def _execute_level4_basic(self, code: str, engine: str, context: Dict,
+                              token: CancellationToken = None, **kwargs) -> ILNResult:
         """Level 4: Multi-Sector Unification (BASIC ONLY - No Advanced Orchestration)"""
         start_time = time.time()
-        essences = self.essence_processor.parse_essences(code)
+        token = token or CancellationToken()
+        essences = self._parse_stage(code, token)
         
         # Level 4 BASIC: Multi-sector coordination (mobile+cloud+ai+web)
         sectors = kwargs.get('sectors', [])
+        selected_sectors = self.sector_registry.select_sectors(essences, sectors)
         
-        # Basic multi-sector processing
-        sector_results = {}
-        
-        if 'mobile' in essences or 'mobile' in sectors:
-            sector_results['mobile'] = {
-                'platform': 'cross_platform_development',
-                'frameworks': ['flutter', 'react_native', 'ionic'],
-                'deployment': 'local_build_process'
-            }
+        # Sectors run concurrently: latency is the slowest sector, not the sum
+        token.check('sectors')
+        token.partial['engine'] = "multi_sector_basic"
+        with PROFILER.stage('sectors'):
+            sector_results, sector_errors, sector_times = self._fan_out_sectors(
+                selected_sectors, essences, context, kwargs.get('sector_timeout'), token.remaining()
+            )
         
-        if 'api' in essences or 'cloud' in sectors:
-            sector_results['cloud'] = {
-                'infrastructure': 'standard_cloud_services',
-                'deployment': 'conventional_deployment',
-                'scaling': 'manual_configuration'
-            }
+        execution_time = time.time() - start_time
         
-        if 'ml' in essences or 'ai' in sectors:
-            sector_results['ai'] = {
-                'models': 'standard_ml_frameworks',
-                'training': 'local_training_process',
-                'inference': 'conventional_api_calls'
-            }
+        performance_metrics = {f"sector_{name}_time": elapsed for name, elapsed in sector_times.items()}
+        performance_metrics['sectors_wall_time'] = execution_time
+        performance_metrics['sectors_cumulative_time'] = sum(sector_times.values())
         
-        if 'event' in essences or 'web' in sectors:
-            sector_results['web'] = {
-                'frontend': 'standard_spa_frameworks',
-                'backend': 'conventional_api_development',
-                'deployment': 'traditional_hosting'
-            }
+        metadata = {
+            'method': 'multi_sector_unification_basic',
+            'sectors_coordinated': list(sector_results.keys()),
+            'sectors_failed': sector_errors,
+            'note': 'Basic multi-sector coordination - Advanced orchestration available separately'
+        }
+        all_failed = bool(selected_sectors) and not sector_results
+        error = "All sectors failed: " + ", ".join(sector_errors) if all_failed else None
         
-        execution_time = time.time() - start_time
+        # The execution budget cut the fan-out short: report a timeout with the partial sectors
+        try:
+            token.check('sectors')
+        except ILNTimeoutError as e:
+            all_failed = True
+            error = str(e)
+            metadata.update(error_type='timeout', timed_out=True, stage=e.stage)
         
         return ILNResult(
-            success=True, level=4, result=sector_results, execution_time=execution_time,
+            success=not all_failed, level=4, result=sector_results, execution_time=execution_time,
             essences_used=list(essences.keys()), engine="multi_sector_basic",
-            metadata={
-                'method': 'multi_sector_unification_basic',
-                'sectors_coordinated': list(sector_results.keys()),
-                'note': 'Basic multi-sector coordination - Advanced orchestration available separately'
-            }
+            metadata=metadata, error=error, performance_metrics=performance_metrics
         )
     
+    def _parse_stage(self, code: str, token: CancellationToken) -> Dict:
+        """Parse essences between deadline checkpoints"""
+        token.check('parse')
+        with PROFILER.stage('parse'):
+            essences = self.shared_tables.get_parse(code) if self.shared_tables is not None else None
+            if essences is None:
+                essences = self.essence_processor.parse_essences(code)
+                if self.shared_tables is not None:
+                    self.shared_tables.put_parse(code, essences)
+        token.partial['essences'] = essences
+        return essences
+    
+    def _run_engine(self, name: str, token: CancellationToken, level: int, method: str,
+                    args: tuple, kwargs: Dict = None, bypass_cache: bool = False, code: str = None) -> Dict:
+        """Run an engine level method under the result cache, admission control and cancellation token
+        
+        `args` starts with the essences parsed from `code`; results are cached only when `code` is given.
+        """
+        kwargs = kwargs or {}
+        token.partial['engine'] = name
+        token.check(f"engine:{name}")
+        engine = self.engine_registry.get_engine(name)
+        engine.cancel_token = token
+        
+        cache_key = None
+        if self.result_cache is not None and engine.deterministic and code is not None:
+            if bypass_cache:
+                self.result_cache.record_bypass()
+            else:
+                cache_key = ResultCache.make_key(type(engine), method, code, args[1:], kwargs)
+                cached = self.result_cache.get(cache_key) if cache_key is not None else None
+                if cached is not None:
+                    return cached
+        
+        if self.admission is None:
+            result = self._call_engine(name, engine, method, *args, **kwargs)
+        else:
+            self.admission.acquire_engine(name, level, token.remaining())
+            try:
+                result = self._call_engine(name, engine, method, *args, **kwargs)
+            finally:
+                self.admission.release_engine(name, level)
+        
+        if cache_key is not None:
+            self.result_cache.put(cache_key, result)
+        return result
+    
+    def _call_engine(self, name: str, engine: 'BaseEngine', method: str, *args, **kwargs) -> Dict:
+        """Invoke engine method, feeding outcome and latency to its circuit breaker"""
+        breaker = self.engine_registry.get_breaker(name)
+        trial = breaker.begin_call() if breaker is not None else False
+        call_start = time.time()
+        try:
+            with PROFILER.stage(f"engine:{name}"):
+                result = getattr(engine, method)(*args, **kwargs)
+        except Exception:
+            if breaker is not None:
+                breaker.record(False, time.time() - call_start, trial)
+            raise
+        if breaker is not None:
+            breaker.record(True, time.time() - call_start, trial)
+        return result
+    
+    def _fan_out_sectors(self, sectors: List[str], essences: Dict, context: Dict,
+                         timeout: Optional[float] = None, budget: Optional[float] = None) -> tuple:
+        """Run sector handlers concurrently, collecting partial results on failure or timeout
+        
+        A sector's timeout counts its run time only, from when a pool thread picks
+        it up; `budget` (the remaining execution deadline) bounds queueing plus
+        running for the whole fan-out. A timed-out handler cannot be interrupted and keeps its pool thread until it
+        returns; while such stranded handlers hold every pool thread, the fan-out is
+        rejected with ILNAdmissionError instead of queuing behind them. Otherwise
+        sectors beyond the free threads simply queue.
+        """
+        if not sectors:
+            return {}, {}, {}
+        
+        with self._sector_executor_lock:
+            stranded = self._stranded_sectors
+        if stranded >= self.sector_workers:
+            raise ILNAdmissionError(
+                f"Sector pool saturated: all {self.sector_workers} threads held by timed-out handlers",
+                'sectors'
+            )
+        
+        executor = self._get_sector_executor()
+        started = time.monotonic()
+        budget_deadline = started + budget if budget is not None else None
+        run_started = {}  # sector -> monotonic time a pool thread began running it
+        futures = {}
+        timeouts = {}
+        for name in sectors:
+            future = executor.submit(self._run_sector, name, essences, context, run_started)
+            futures[future] = name
+            timeouts[future] = timeout if timeout is not None else self.sector_registry.get_timeout(name)
+        
+        def deadline_of(future) -> Optional[float]:
+            begun = run_started.get(futures[future])
+            deadline = begun + timeouts[future] if begun is not None else None
+            if budget_deadline is not None and (deadline is None or budget_deadline < deadline):
+                deadline = budget_deadline
+            return deadline
+        
+        outcomes = {}
+        sector_errors = {}
+        sector_times = {}
+        pending = set(futures)
+        while pending:
+            now = time.monotonic()
+            deadlines = {future: deadline_of(future) for future in pending}
+            for future in [f for f in pending if deadlines[f] is not None and deadlines[f] <= now]:
+                name = futures[future]
+                if future.cancel():
+                    sector_errors[name] = f"timed out queued after {now - started:.3f}s"
+                else:
+                    self._strand_sector(future)
+                    sector_errors[name] = f"timed out after {now - run_started.get(name, started):.3f}s"
+                pending.discard(future)
+                sector_times[name] = now - started
+            if not pending:
+                break
+            
+            # Queued sectors get a deadline once they start: re-check at least every SECTOR_START_POLL
+            wait_for = min((deadlines[f] - now for f in pending if deadlines[f] is not None), default=None)
+            if any(futures[f] not in run_started for f in pending):
+                wait_for = self.SECTOR_START_POLL if wait_for is None else min(wait_for, self.SECTOR_START_POLL)
+            done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = futures[future]
+                try:
+                    outcomes[name], sector_times[name] = future.result()
+                except Exception as e:
+                    sector_errors[name] = str(e)
+                    sector_times[name] = time.monotonic() - started
+        
+        # Keep the caller-visible ordering stable regardless of completion order
+        sector_results = {name: outcomes[name] for name in sectors if name in outcomes}
+        return sector_results, sector_errors, sector_times
+    
+    def _strand_sector(self, future: Future):
+        """Count a running, timed-out handler until it finally returns"""
+        with self._sector_executor_lock:
+            self._stranded_sectors += 1
+        
+        def release(_):
+            with self._sector_executor_lock:
+                self._stranded_sectors -= 1
+        future.add_done_callback(release)
+    
+    def _run_sector(self, name: str, essences: Dict, context: Dict, run_started: Dict = None) -> tuple:
+        """Execute one sector handler and time it"""
+        if run_started is not None:
+            run_started[name] = time.monotonic()
+        handler = self.sector_registry.get_handler(name)
+        sector_start = time.time()
+        # Runs on a pool thread: carry the full stage path for attribution
+        with PROFILER.stage('execute:level4', f"sector:{name}"):
+            result = handler(essences, context)
+        return result, time.time() - sector_start
+    
+    def _get_sector_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the shared sector thread pool"""
+        if self._sector_executor is None:
+            with self._sector_executor_lock:
+                if self._sector_executor is None:
+                    self._sector_executor = ThreadPoolExecutor(
+                        max_workers=self.sector_workers, thread_name_prefix='iln-sector'
+                    )
+        return self._sector_executor
+    
     # Convenience methods
+    def register_essence(self, name: str, pattern: Optional[str] = None,
+                         bonus_engines: List[str] = None) -> int:
+        """Register custom essence (e.g. cache!, queue!) - see EssenceProcessor.register_essence"""
+        version = self.essence_processor.register_essence(name, pattern, bonus_engines)
+        if self.shared_tables is not None:
+            self.shared_tables.invalidate_parses()
+        return version
+    
+    def set_parse_limits(self, limits: ParseLimits) -> int:
+        """Change the essence parser limits - see EssenceProcessor.set_parse_limits"""
+        version = self.essence_processor.set_parse_limits(limits)
+        if self.shared_tables is not None:
+            self.shared_tables.invalidate_parses()
+        return version
+    
     def level1(self, code: str, engine: str = "auto") -> ILNResult:
         return self.execute(code, level=1, engine=engine)
     
@@ -423,11 +1956,12 @@ class ILN:
         context = {'base_language': base_language}
         return self.execute(code, level=3, champion=champion, context=context)
     
-    def level4(self, code: str, sectors: List[str] = None) -> ILNResult:
+    def level4(self, code: str, sectors: List[str] = None, sector_timeout: float = None) -> ILNResult:
         """Level 4 Basic Multi-Sector Unification"""
         if not self.has_pro:
-            logger.warning("❌ Level 4 requires Pro. Contact: nexusstudio100@gmail.com")
-        return self.execute(code, level=4, sectors=sectors or [])
+            log_event('level_requires_pro', logging.WARNING, "Level 4 requires Pro. Contact: %s", __email__,
+                      level=4)
+        return self.execute(code, level=4, sectors=sectors or [], sector_timeout=sector_timeout)
     
     def demo(self) -> None:
         """Enhanced demo"""
@@ -453,6 +1987,27 @@ class ILN:
                 print(f"❌ Error: {result.error}")
             print()
     
+    def start_profiler(self, sample_rate: Optional[float] = None):
+        """Start the process-wide sampling profiler (see ILNProfiler)"""
+        PROFILER.start(sample_rate)
+    
+    def stop_profiler(self, path: Optional[str] = None) -> str:
+        """Stop profiling; returns collapsed stacks and writes them to `path` if given"""
+        PROFILER.stop()
+        if path:
+            PROFILER.write_collapsed(path)
+        return PROFILER.collapsed()
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Runtime metrics (admission queues, wait times, coalescing, circuit breakers, log event counts)"""
+        return {
+            'admission': self.admission.get_metrics() if self.admission is not None else {},
+            'single_flight': self.single_flight.get_metrics() if self.single_flight is not None else {},
+            'circuit_breakers': self.engine_registry.get_breaker_metrics(),
+            'stranded_sectors': self._stranded_sectors,
+            'log_events': get_log_counts()
+        }
+    
     def get_info(self) -> Dict[str, Any]:
         """System information"""
         return {
@@ -463,27 +2018,629 @@ class ILN:
             'has_pro': self.has_pro,
             'levels_available': [1, 2] if not self.has_pro else [1, 2, 3, 4],
             'engines': list(self.engine_registry._engines.keys()),
+            'sectors': list(self.sector_registry._handlers.keys()),
             'supported_essences': list(self.essence_processor.ESSENCE_PATTERNS.keys()),
+            'parse_limits': asdict(self.essence_processor.PARSE_LIMITS),
+            'result_cache': self.result_cache.get_stats() if self.result_cache is not None else None,
+            'shared_tables': self.shared_tables.get_stats() if self.shared_tables is not None else None,
             'install_command': 'pip install git+https://github.com/Tryboy869/iln-nexus.git@v2.0.0',
             'github_repo': 'https://github.com/Tryboy869/iln-nexus'
         }
 
+# ===== SAMPLING PROFILER =====
+
+class _NullStage:
+    """No-op stage scope used while the profiler is off"""
+    
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+_NULL_STAGE = _NullStage()
+
+class _StageScope:
+    """Pushes stage names on the current thread's ILN stage stack"""
+    
+    __slots__ = ('stack', 'names')
+    
+    def __init__(self, stack: List[str], names: tuple):
+        self.stack = stack
+        self.names = names
+    
+    def __enter__(self):
+        self.stack.extend(self.names)
+        return self
+    
+    def __exit__(self, *exc_info):
+        del self.stack[len(self.stack) - len(self.names):]
+        return False
+
+class ILNProfiler:
+    """Low-overhead sampling profiler attributing time to ILN stages and engines
+    
+    Instrumented code marks stages (parse, score, champion, engine:<name>,
+    sector:<name>); while running, a background thread samples every thread's
+    current stage stack `sample_rate` times per second. Overhead is bounded by
+    the sample rate, and stage markers are a single flag check while stopped.
+    Output is collapsed-stack text for flamegraph.pl / speedscope / inferno.
+    """
+    
+    def __init__(self, sample_rate: float = 97.0, include_frames: bool = False):
+        self.sample_rate = sample_rate
+        self.include_frames = include_frames
+        self.active = False
+        self._stacks: Dict[int, List[str]] = {}
+        self._counts = defaultdict(int)
+        self._samples = 0
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+    
+    def stage(self, *names: str):
+        """Context manager marking the current thread as inside `names`"""
+        if not self.active:
+            return _NULL_STAGE
+        ident = threading.get_ident()
+        stack = self._stacks.get(ident)
+        if stack is None:
+            stack = self._stacks[ident] = []
+        return _StageScope(stack, names)
+    
+    def start(self, sample_rate: Optional[float] = None):
+        with self._lock:
+            if self.active:
+                return
+            if sample_rate is not None:
+                self.sample_rate = sample_rate
+            self._stop_event.clear()
+            self.active = True
+            self._thread = threading.Thread(target=self._sample_loop, name='iln-profiler', daemon=True)
+            self._thread.start()
+        log_event('profiler_started', logging.INFO, "Profiler started at %g Hz", self.sample_rate,
+                  sample_rate=self.sample_rate)
+    
+    def stop(self):
+        with self._lock:
+            if not self.active:
+                return
+            self.active = False
+            self._stop_event.set()
+            thread = self._thread
+        thread.join()
+        self._stacks.clear()
+        log_event('profiler_stopped', logging.INFO, "Profiler stopped (%d samples)", self._samples,
+                  samples=self._samples)
+    
+    def toggle(self, path: Optional[str] = None):
+        """Start, or stop and (optionally) write collapsed output"""
+        if self.active:
+            self.stop()
+            if path:
+                self.write_collapsed(path)
+        else:
+            self.start()
+    
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+            self._samples = 0
+    
+    def _sample_loop(self):
+        interval = 1.0 / self.sample_rate
+        own_ident = threading.get_ident()
+        while not self._stop_event.wait(interval):
+            frames = sys._current_frames() if self.include_frames else None
+            with self._lock:
+                for ident, stack in list(self._stacks.items()):
+                    if ident == own_ident or not stack:
+                        continue
+                    key = ';'.join(stack)
+                    if frames is not None and ident in frames:
+                        key += ';' + self._frame_path(frames[ident])
+                    self._counts[key] += 1
+                self._samples += 1
+    
+    @staticmethod
+    def _frame_path(frame, depth: int = 8) -> str:
+        names = []
+        while frame is not None and len(names) < depth:
+            names.append(frame.f_code.co_name)
+            frame = frame.f_back
+        return ';'.join(reversed(names))
+    
+    def collapsed(self) -> str:
+        """Collapsed stacks: `stage;stage;... count` per line"""
+        with self._lock:
+            return ''.join(f"{stack} {count}\n" for stack, count in sorted(self._counts.items()))
+    
+    def write_collapsed(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.collapsed())
+        log_event('profile_written', logging.INFO, "Profile written to %s", path, path=path)
+    
+    def install_signal_toggle(self, path: str = 'iln-profile.collapsed', signum: Optional[int] = None):
+        """Toggle profiling on a signal (default SIGUSR2); writes `path` when stopping. Main thread only."""
+        signum = signum if signum is not None else signal.SIGUSR2
+        # Stopping joins the sampler thread, so do it off the signal handler
+        signal.signal(signum, lambda *_: threading.Thread(target=self.toggle, args=(path,), daemon=True).start())
+
+PROFILER = ILNProfiler()
+
+# ===== JOB SCHEDULING =====
+
+class _ScheduledJob:
+    """Queued ILN.execute call with its cost estimate and completion future"""
+    
+    __slots__ = ('args', 'kwargs', 'priority', 'cost', 'future', 'enqueued_at')
+    
+    def __init__(self, args: tuple, kwargs: Dict, priority: str, cost: float):
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.cost = cost
+        self.future = Future()
+        self.enqueued_at = time.monotonic()
+
+class _SchedulerWorker:
+    """Per-worker deques (one per priority class) plus outstanding cost"""
+    
+    def __init__(self, classes: tuple, weights: Dict[str, int]):
+        self.lock = threading.Lock()
+        self.deques = {priority: deque() for priority in classes}
+        self.weights = weights
+        self.credit = dict.fromkeys(classes, 0)  # smooth weighted round-robin state
+        self.queued_cost = 0.0
+    
+    def push(self, job: _ScheduledJob):
+        with self.lock:
+            self.deques[job.priority].append(job)
+            self.queued_cost += job.cost
+    
+    def pop(self, steal: bool = False) -> Optional[_ScheduledJob]:
+        """Owner takes the oldest job (FIFO); thieves take the newest from the far end
+        
+        Non-empty classes share dequeues in proportion to their weights, so a
+        class with waiting jobs is served within one round however busy the others are.
+        """
+        with self.lock:
+            ready = [priority for priority, jobs in self.deques.items() if jobs]
+            if not ready:
+                return None
+            for priority in ready:
+                self.credit[priority] += self.weights[priority]
+            chosen = max(ready, key=self.credit.__getitem__)
+            self.credit[chosen] -= sum(self.weights[priority] for priority in ready)
+            jobs = self.deques[chosen]
+            job = jobs.pop() if steal else jobs.popleft()
+            self.queued_cost -= job.cost
+            return job
+
+class ILNScheduler:
+    """Work-stealing scheduler for mixed-level ILN.execute jobs
+    
+    Jobs are placed on the worker with the least queued cost (estimated from
+    level and input size) and dequeued by weighted round-robin across priority
+    classes: `priority` is an engine-scoring preference, not urgency, so no
+    class may starve another. Idle workers steal
+    from the most loaded worker, so cheap Level 1/2 jobs never wait behind a
+    heavy Level 3/4 job that happens to share their queue.
+    """
+    
+    # Priority classes (the `priority` argument of ILN.execute), served in equal shares by default
+    PRIORITY_CLASSES = ('reactive', 'performance', 'balanced', 'safety')
+    LEVEL_COSTS = {1: 1.0, 2: 1.5, 3: 4.0, 4: 8.0}
+    
+    def __init__(self, iln: 'ILN', workers: int = 4, class_order: List[str] = None,
+                 latency_samples: int = 1024, class_weights: Dict[str, int] = None):
+        self.iln = iln
+        self.class_order = tuple(class_order or self.PRIORITY_CLASSES)
+        weights = {priority: 1 for priority in self.class_order}
+        weights.update({priority: max(1, int(weight)) for priority, weight in (class_weights or {}).items()
+                        if priority in weights})
+        self.class_weights = weights
+        self._workers = [_SchedulerWorker(self.class_order, weights) for _ in range(workers)]
+        self._wakeup = threading.Condition()
+        self._pending = 0
+        self._shutdown = False
+        self._steals = 0
+        self._latencies = {priority: deque(maxlen=latency_samples) for priority in self.class_order}
+        self._completed = defaultdict(int)
+        self._threads = [
+            threading.Thread(target=self._worker_loop, args=(index,), name=f"iln-scheduler-{index}", daemon=True)
+            for index in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+    
+    @classmethod
+    def estimate_cost(cls, iln_code: str, level: int) -> float:
+        """Relative job cost from level and input size"""
+        return cls.LEVEL_COSTS.get(level, 1.0) * (1.0 + len(iln_code) / 1024.0)
+    
+    def submit(self, iln_code: str, level: int = 1, engine: str = "auto", priority: str = "balanced",
+               context: Dict = None, **kwargs) -> Future:
+        """Queue an ILN.execute call; returns a Future resolving to its ILNResult"""
+        if priority not in self.class_order:
+            priority = 'balanced' if 'balanced' in self.class_order else self.class_order[-1]
+        context = dict(context or {})
+        context.setdefault('priority', priority)
+        job = _ScheduledJob((iln_code, level, engine, context), dict(kwargs, priority=priority),
+                            priority, self.estimate_cost(iln_code, level))
+        
+        with self._wakeup:
+            if self._shutdown:
+                raise RuntimeError("ILNScheduler is shut down")
+            target = min(self._workers, key=lambda worker: worker.queued_cost)
+            target.push(job)
+            self._pending += 1
+            self._wakeup.notify()
+        return job.future
+    
+    def _next_job(self, index: int) -> Optional[_ScheduledJob]:
+        job = self._workers[index].pop()
+        if job is not None:
+            return job
+        
+        victims = sorted((worker for position, worker in enumerate(self._workers) if position != index),
+                         key=lambda worker: worker.queued_cost, reverse=True)
+        for victim in victims:
+            job = victim.pop(steal=True)
+            if job is not None:
+                with self._wakeup:
+                    self._steals += 1
+                return job
+        return None
+    
+    def _worker_loop(self, index: int):
+        while True:
+            with self._wakeup:
+                while self._pending == 0 and not self._shutdown:
+                    self._wakeup.wait()
+                if self._pending == 0 and self._shutdown:
+                    return
+                self._pending -= 1
+            
+            job = self._next_job(index)
+            while job is None:
+                # Count was claimed before the job became visible to this worker; retry
+                time.sleep(0)
+                job = self._next_job(index)
+            
+            queued_for = time.monotonic() - job.enqueued_at
+            if not job.future.set_running_or_notify_cancel():
+                continue
+            try:
+                job.future.set_result(self.iln.execute(*job.args, **job.kwargs))
+            except BaseException as e:
+                job.future.set_exception(e)
+            with self._wakeup:
+                self._latencies[job.priority].append(queued_for)
+                self._completed[job.priority] += 1
+    
+    def shutdown(self, wait: bool = True):
+        """Stop accepting jobs; workers drain the queues before exiting"""
+        with self._wakeup:
+            self._shutdown = True
+            self._wakeup.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Per-class queueing latency, steal count and per-worker queued cost"""
+        with self._wakeup:
+            classes = {}
+            for priority, samples in self._latencies.items():
+                ordered = sorted(samples)
+                classes[priority] = {
+                    'completed': self._completed[priority],
+                    'avg_queue_time': sum(ordered) / len(ordered) if ordered else 0.0,
+                    'p95_queue_time': ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)] if ordered else 0.0,
+                    'max_queue_time': ordered[-1] if ordered else 0.0
+                }
+            return {
+                'classes': classes,
+                'pending': self._pending,
+                'steals': self._steals,
+                'worker_queued_cost': [worker.queued_cost for worker in self._workers]
+            }
+
+# ===== DISTRIBUTED EXECUTION =====
+
+@dataclass
+class DistributedRunReport:
+    """Outcome of a coordinator run - results are in input order"""
+    results: List[ILNResult]
+    shards: int
+    failed_shards: List[int]
+    retries: int
+    elapsed: float
+    throughput: float
+    programs_per_worker: Dict[str, int] = field(default_factory=dict)
+
+def _result_to_wire(result: ILNResult) -> Dict:
+    return asdict(result)
+
+def _result_from_wire(data: Dict) -> ILNResult:
+    return ILNResult(**data)
+
+def run_worker(address, authkey: bytes, api_key: Optional[str] = None):
+    """Worker process loop: receive shards from a coordinator, execute, send results back"""
+    iln = ILN(api_key=api_key)
+    with Client(address, authkey=authkey) as conn:
+        conn.send(('hello', f"{socket.gethostname()}:{os.getpid()}"))
+        while True:
+            try:
+                message = conn.recv()
+            except EOFError:
+                return
+            if message[0] == 'stop':
+                return
+            
+            _, shard_id, programs, options = message
+            try:
+                results = [_result_to_wire(iln.execute(code, **options)) for code in programs]
+                conn.send(('result', shard_id, results))
+            except Exception as e:
+                conn.send(('error', shard_id, str(e)))
+
+class ILNCoordinator:
+    """Shards a corpus of ILN programs across worker processes over a socket transport
+    
+    Workers connect through multiprocessing.connection (TCP `(host, port)` or a
+    Unix socket path), either spawned locally via `local_workers` or started on
+    other hosts with `iln --worker HOST:PORT`. Shards from lost or failing
+    workers are retried up to `max_retries` times.
+    """
+    
+    LIVENESS_POLL = 0.25  # seconds between local worker liveness checks
+    
+    def __init__(self, address=('127.0.0.1', 0), authkey: Optional[bytes] = None,
+                 shard_size: int = 1000, max_retries: int = 3, api_key: Optional[str] = None):
+        self.address = address
+        self.authkey = authkey or os.urandom(16)
+        self.shard_size = shard_size
+        self.max_retries = max_retries
+        self.api_key = api_key
+    
+    def run(self, programs: List[str], local_workers: int = 0, run_timeout: Optional[float] = None,
+            on_listening: Callable[[Any], None] = None, **options) -> DistributedRunReport:
+        """Execute every program (ILN.execute `options` apply to all) and merge results in order
+        
+        `run_timeout` bounds the whole run; a `timeout` option is the per-program budget.
+        """
+        programs = list(programs)
+        shards = [programs[start:start + self.shard_size]
+                  for start in range(0, len(programs), self.shard_size)]
+        state = {
+            'queue': deque((shard_id, 0) for shard_id in range(len(shards))),
+            'results': [None] * len(shards),
+            'failed': [],
+            'attempts': [0] * len(shards),
+            'retries': 0,
+            'done': 0,
+            'per_worker': defaultdict(int),
+            'workers': 0,
+            'closed': False
+        }
+        cond = threading.Condition()
+        run_start = time.time()
+        
+        listener = Listener(self.address, authkey=self.authkey)
+        if on_listening is not None:
+            on_listening(listener.address)
+        processes = []
+        ctx = multiprocessing.get_context('spawn')
+        for _ in range(local_workers):
+            process = ctx.Process(target=run_worker, args=(listener.address, self.authkey, self.api_key),
+                                  daemon=True)
+            process.start()
+            processes.append(process)
+        
+        def serve(conn):
+            with conn:
+                try:
+                    worker_id = conn.recv()[1]
+                except (EOFError, OSError):
+                    return
+                with cond:
+                    state['workers'] += 1
+                try:
+                    self._serve_worker(conn, worker_id, shards, state, cond, options)
+                finally:
+                    with cond:
+                        state['workers'] -= 1
+                        cond.notify_all()
+        
+        def accept_loop():
+            while True:
+                try:
+                    conn = listener.accept()
+                except (OSError, EOFError):
+                    return
+                except Exception:
+                    continue  # failed handshake (bad authkey)
+                threading.Thread(target=serve, args=(conn,), daemon=True).start()
+        
+        threading.Thread(target=accept_loop, name='iln-coordinator-accept', daemon=True).start()
+        
+        run_deadline = time.monotonic() + run_timeout if run_timeout is not None else None
+        try:
+            with cond:
+                # Worker deaths are not notified (e.g. a spawn that never connects): poll liveness
+                while True:
+                    wait = self.LIVENESS_POLL
+                    if run_deadline is not None:
+                        wait = min(wait, max(run_deadline - time.monotonic(), 0.0))
+                    finished = cond.wait_for(lambda: state['done'] == len(shards), timeout=wait)
+                    if finished or self._stalled(state, processes):
+                        break
+                    if run_deadline is not None and time.monotonic() >= run_deadline:
+                        break
+                if state['done'] < len(shards):
+                    for shard_id, _ in state['queue']:
+                        state['failed'].append(shard_id)
+                    state['queue'].clear()
+                state['closed'] = True
+                cond.notify_all()
+        finally:
+            listener.close()
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+        
+        merged = []
+        for shard_id, shard in enumerate(shards):
+            shard_results = state['results'][shard_id]
+            if shard_results is None:
+                attempts = state['attempts'][shard_id]
+                error = (f"Shard {shard_id} failed after {attempts} attempt(s)" if attempts
+                         else f"Shard {shard_id} never ran: no worker available")
+                shard_results = [ILNResult(success=False, level=options.get('level', 1), result=None,
+                                           execution_time=0, essences_used=[], engine='none', error=error,
+                                           metadata={'error_type': 'shard_failed', 'shard': shard_id,
+                                                     'attempts': attempts})
+                                 for _ in shard]
+            merged.extend(shard_results)
+        
+        elapsed = time.time() - run_start
+        return DistributedRunReport(
+            results=merged, shards=len(shards), failed_shards=sorted(set(state['failed'])),
+            retries=state['retries'], elapsed=elapsed,
+            throughput=len(programs) / elapsed if elapsed > 0 else 0.0,
+            programs_per_worker=dict(state['per_worker'])
+        )
+    
+    def _stalled(self, state: Dict, processes: List) -> bool:
+        """No connected worker and no local worker left alive to pick up queued shards"""
+        return (bool(processes) and state['workers'] == 0
+                and not any(process.is_alive() for process in processes))
+    
+    def _serve_worker(self, conn, worker_id: str, shards: List[List[str]], state: Dict,
+                      cond: threading.Condition, options: Dict):
+        while True:
+            with cond:
+                cond.wait_for(lambda: state['queue'] or state['done'] == len(shards) or state['closed'])
+                if not state['queue']:
+                    try:
+                        conn.send(('stop',))
+                    except OSError:
+                        pass
+                    return
+                shard_id, attempt = state['queue'].popleft()
+                state['attempts'][shard_id] = attempt + 1
+            
+            try:
+                conn.send(('shard', shard_id, shards[shard_id], options))
+                reply = conn.recv()
+            except (EOFError, OSError):
+                self._shard_failed(shard_id, attempt, state, cond)
+                return  # connection lost: this worker is gone
+            
+            if reply[0] == 'result':
+                with cond:
+                    state['results'][shard_id] = [_result_from_wire(data) for data in reply[2]]
+                    state['per_worker'][worker_id] += len(shards[shard_id])
+                    state['done'] += 1
+                    cond.notify_all()
+            else:
+                log_event('shard_failed', logging.WARNING, "Shard %d failed on %s: %s",
+                          shard_id, worker_id, reply[2], shard=shard_id, worker=worker_id)
+                self._shard_failed(shard_id, attempt, state, cond)
+    
+    def _shard_failed(self, shard_id: int, attempt: int, state: Dict, cond: threading.Condition):
+        with cond:
+            if attempt < self.max_retries:
+                state['queue'].append((shard_id, attempt + 1))
+                state['retries'] += 1
+            else:
+                state['failed'].append(shard_id)
+                state['done'] += 1
+            cond.notify_all()
+
 # ===== ENGINE IMPLEMENTATIONS =====
 
 class BaseEngine(ABC):
-    def __init__(self, name: str):
-        self.name = name
+    """Engine base with a table-driven executor
+    
+    An engine is declared as data - ENGINE_NAME, ESSENCE_FORMATS, DEFAULT_FORMAT,
+    ADVANTAGES, LEVEL2_OPTIMIZATION and COUNT_METRICS - and this class runs it.
+    Engines needing custom behaviour can still override the execute_level* methods.
+    """
+    
+    ENGINE_NAME = ""
+    
+    # Pure function of (essences, context, level, kwargs) - eligible for the result cache
+    deterministic = False
+    
+    # Essence name -> format string taking the instance count; DEFAULT_FORMAT otherwise
+    ESSENCE_FORMATS: Dict[str, str] = {}
+    DEFAULT_FORMAT = "native: {} operations"
+    
+    ADVANTAGES: List[str] = []
+    LEVEL2_OPTIMIZATION = "standard coordination"
+    
+    # Extra Level 1 metrics: key -> (per-essence scale, offset)
+    COUNT_METRICS: Dict[str, tuple] = {}
+    
+    def __init__(self, name: str = None):
+        self.name = name or self.ENGINE_NAME
         self.execution_count = 0
+        self.cancel_token: Optional[CancellationToken] = None
+    
+    def check_cancelled(self):
+        """Cooperative checkpoint: raise ILNTimeoutError when the bound token expired"""
+        if self.cancel_token is not None:
+            self.cancel_token.check(f"engine:{self.name}")
+    
+    @classmethod
+    def _format_table(cls) -> List[str]:
+        """Formatter table indexed by essence ID (rebuilt when new essences are interned)"""
+        table = cls.__dict__.get('_essence_table')
+        if table is None or len(table) != len(EssenceProcessor.ESSENCE_NAMES):
+            table = [cls.ESSENCE_FORMATS.get(name, cls.DEFAULT_FORMAT)
+                     for name in EssenceProcessor.ESSENCE_NAMES]
+            cls._essence_table = table
+        return table
+    
+    def process_essences(self, essences: Dict) -> Dict[str, str]:
+        """Format each essence through the ID-indexed handler table"""
+        essence_ids = EssenceProcessor.essence_ids(essences)
+        table = self._format_table()
+        processed_essences = {}
+        for essence_id, (essence_type, essence_data) in zip(essence_ids, essences.items()):
+            self.check_cancelled()
+            processed_essences[essence_type] = table[essence_id].format(len(essence_data))
+        return processed_essences
     
-    @abstractmethod
     def execute_level1(self, essences: Dict, context: Dict) -> Dict:
         """Execute Level 1 - Basic essence absorption"""
-        pass
+        self.execution_count += 1
+        
+        result = {
+            'engine': self.name,
+            'level': 1,
+            'processed_essences': self.process_essences(essences),
+            'advantages': list(self.ADVANTAGES)
+        }
+        for metric, (scale, offset) in self.COUNT_METRICS.items():
+            result[metric] = len(essences) * scale + offset
+        return result
     
-    @abstractmethod
     def execute_level2(self, essences: Dict, context: Dict, **kwargs) -> Dict:
         """Execute Level 2 - Multi-engine coordination"""
-        pass
+        result = self.execute_level1(essences, context)
+        result.update({
+            'level': 2,
+            'optimization': self.LEVEL2_OPTIMIZATION,
+            'performance_mode': kwargs.get('priority', 'balanced')
+        })
+        return result
     
     def execute_level3(self, essences: Dict, context: Dict, base_language: str, **kwargs) -> Dict:
         """Execute Level 3 - Champion cascade"""
@@ -494,6 +2651,7 @@ class BaseEngine(ABC):
         
         coordinated_essences = []
         for essence_type, essence_data in essences.items():
+            self.check_cancelled()
             coordinated_essences.append(f"{essence_type}({len(essence_data)} instances)")
         
         cascade_steps.append(f"{self.name} coordinates: {', '.join(coordinated_essences)}")
@@ -509,245 +2667,114 @@ class BaseEngine(ABC):
             'performance_boost': f"{len(essences) * 50}% theoretical improvement"
         }
 
+def define_engine(name: str, essence_formats: Dict[str, str], default_format: str,
+                  advantages: List[str], level2_optimization: str,
+                  count_metrics: Dict[str, tuple] = None, deterministic: bool = True) -> type:
+    """Build an engine class from a declarative definition (for register_engine)"""
+    class_name = ''.join(part.capitalize() for part in re.split(r'[^0-9a-zA-Z]+', name)) + 'Engine'
+    return type(class_name, (BaseEngine,), {
+        'ENGINE_NAME': name,
+        'deterministic': deterministic,
+        'ESSENCE_FORMATS': dict(essence_formats),
+        'DEFAULT_FORMAT': default_format,
+        'ADVANTAGES': list(advantages),
+        'LEVEL2_OPTIMIZATION': level2_optimization,
+        'COUNT_METRICS': dict(count_metrics or {})
+    })
+
 class PythonEngine(BaseEngine):
-    def __init__(self):
-        super().__init__("python")
-    
-    def execute_level1(self, essences: Dict, context: Dict) -> Dict:
-        self.execution_count += 1
-        
-        processed_essences = {}
-        for essence_type, essence_data in essences.items():
-            if essence_type == 'ml':
-                processed_essences[essence_type] = f"scikit-learn/tensorflow: {len(essence_data)} models"
-            elif essence_type == 'api':
-                processed_essences[essence_type] = f"fastapi/flask: {len(essence_data)} endpoints"
-            elif essence_type == 'stream':
-                processed_essences[essence_type] = f"asyncio streams: {len(essence_data)} channels"
-            else:
-                processed_essences[essence_type] = f"python native: {len(essence_data)} operations"
-        
-        return {
-            'engine': self.name,
-            'level': 1,
-            'processed_essences': processed_essences,
-            'advantages': ['readable', 'rich_ecosystem', 'rapid_development']
-        }
-    
-    def execute_level2(self, essences: Dict, context: Dict, **kwargs) -> Dict:
-        result = self.execute_level1(essences, context)
-        result.update({
-            'level': 2,
-            'optimization': 'asyncio + multiprocessing coordination',
-            'performance_mode': kwargs.get('priority', 'balanced')
-        })
-        return result
+    ENGINE_NAME = "python"
+    deterministic = True
+    ESSENCE_FORMATS = {
+        'ml': "scikit-learn/tensorflow: {} models",
+        'api': "fastapi/flask: {} endpoints",
+        'stream': "asyncio streams: {} channels"
+    }
+    DEFAULT_FORMAT = "python native: {} operations"
+    ADVANTAGES = ['readable', 'rich_ecosystem', 'rapid_development']
+    LEVEL2_OPTIMIZATION = 'asyncio + multiprocessing coordination'
 
 class NodeJSEngine(BaseEngine):
-    def __init__(self):
-        super().__init__("nodejs")
-    
-    def execute_level1(self, essences: Dict, context: Dict) -> Dict:
-        self.execution_count += 1
-        
-        processed_essences = {}
-        for essence_type, essence_data in essences.items():
-            if essence_type == 'event':
-                processed_essences[essence_type] = f"EventEmitter: {len(essence_data)} listeners"
-            elif essence_type == 'api':
-                processed_essences[essence_type] = f"Express/Fastify: {len(essence_data)} routes"
-            elif essence_type == 'stream':
-                processed_essences[essence_type] = f"Node streams: {len(essence_data)} pipelines"
-            else:
-                processed_essences[essence_type] = f"nodejs native: {len(essence_data)} operations"
-        
-        return {
-            'engine': self.name,
-            'level': 1,
-            'processed_essences': processed_essences,
-            'advantages': ['event_driven', 'non_blocking_io', 'npm_ecosystem']
-        }
-    
-    def execute_level2(self, essences: Dict, context: Dict, **kwargs) -> Dict:
-        result = self.execute_level1(essences, context)
-        result.update({
-            'level': 2,
-            'optimization': 'cluster + worker_threads',
-            'performance_mode': kwargs.get('priority', 'balanced')
-        })
-        return result
+    ENGINE_NAME = "nodejs"
+    deterministic = True
+    ESSENCE_FORMATS = {
+        'event': "EventEmitter: {} listeners",
+        'api': "Express/Fastify: {} routes",
+        'stream': "Node streams: {} pipelines"
+    }
+    DEFAULT_FORMAT = "nodejs native: {} operations"
+    ADVANTAGES = ['event_driven', 'non_blocking_io', 'npm_ecosystem']
+    LEVEL2_OPTIMIZATION = 'cluster + worker_threads'
 
 class GoEngine(BaseEngine):
-    def __init__(self):
-        super().__init__("go")
-    
-    def execute_level1(self, essences: Dict, context: Dict) -> Dict:
-        self.execution_count += 1
-        
-        processed_essences = {}
-        for essence_type, essence_data in essences.items():
-            if essence_type == 'chan':
-                processed_essences[essence_type] = f"goroutines + channels: {len(essence_data)} flows"
-            elif essence_type == 'concurrent':
-                processed_essences[essence_type] = f"goroutine pools: {len(essence_data)} tasks"
-            elif essence_type == 'stream':
-                processed_essences[essence_type] = f"buffered channels: {len(essence_data)} streams"
-            else:
-                processed_essences[essence_type] = f"go native: {len(essence_data)} operations"
-        
-        return {
-            'engine': self.name,
-            'level': 1,
-            'processed_essences': processed_essences,
-            'advantages': ['fast_compilation', 'built_in_concurrency', 'static_typing'],
-            'goroutines_spawned': len(essences) * 10
-        }
-    
-    def execute_level2(self, essences: Dict, context: Dict, **kwargs) -> Dict:
-        result = self.execute_level1(essences, context)
-        result.update({
-            'level': 2,
-            'optimization': 'work-stealing scheduler + channel multiplexing',
-            'performance_mode': kwargs.get('priority', 'balanced')
-        })
-        return result
+    ENGINE_NAME = "go"
+    deterministic = True
+    ESSENCE_FORMATS = {
+        'chan': "goroutines + channels: {} flows",
+        'concurrent': "goroutine pools: {} tasks",
+        'stream': "buffered channels: {} streams"
+    }
+    DEFAULT_FORMAT = "go native: {} operations"
+    ADVANTAGES = ['fast_compilation', 'built_in_concurrency', 'static_typing']
+    LEVEL2_OPTIMIZATION = 'work-stealing scheduler + channel multiplexing'
+    COUNT_METRICS = {'goroutines_spawned': (10, 0)}
 
 class RustEngine(BaseEngine):
-    def __init__(self):
-        super().__init__("rust")
-    
-    def execute_level1(self, essences: Dict, context: Dict) -> Dict:
-        self.execution_count += 1
-        
-        processed_essences = {}
-        for essence_type, essence_data in essences.items():
-            if essence_type == 'own':
-                processed_essences[essence_type] = f"ownership system: {len(essence_data)} zero-copy ops"
-            elif essence_type == 'secure':
-                processed_essences[essence_type] = f"memory-safe: {len(essence_data)} validated"
-            elif essence_type == 'concurrent':
-                processed_essences[essence_type] = f"rayon parallel: {len(essence_data)} thread-safe"
-            else:
-                processed_essences[essence_type] = f"rust native: {len(essence_data)} operations"
-        
-        return {
-            'engine': self.name,
-            'level': 1,
-            'processed_essences': processed_essences,
-            'advantages': ['zero_cost_abstractions', 'memory_safety', 'thread_safety'],
-            'memory_leaks_prevented': len(essences) * 100 + 1337
-        }
-    
-    def execute_level2(self, essences: Dict, context: Dict, **kwargs) -> Dict:
-        result = self.execute_level1(essences, context)
-        result.update({
-            'level': 2,
-            'optimization': 'LLVM optimizations + zero-cost abstractions',
-            'performance_mode': kwargs.get('priority', 'balanced')
-        })
-        return result
+    ENGINE_NAME = "rust"
+    deterministic = True
+    ESSENCE_FORMATS = {
+        'own': "ownership system: {} zero-copy ops",
+        'secure': "memory-safe: {} validated",
+        'concurrent': "rayon parallel: {} thread-safe"
+    }
+    DEFAULT_FORMAT = "rust native: {} operations"
+    ADVANTAGES = ['zero_cost_abstractions', 'memory_safety', 'thread_safety']
+    LEVEL2_OPTIMIZATION = 'LLVM optimizations + zero-cost abstractions'
+    COUNT_METRICS = {'memory_leaks_prevented': (100, 1337)}
 
 class JavaEngine(BaseEngine):
-    def __init__(self):
-        super().__init__("java")
-    
-    def execute_level1(self, essences: Dict, context: Dict) -> Dict:
-        self.execution_count += 1
-        
-        processed_essences = {}
-        for essence_type, essence_data in essences.items():
-            if essence_type == 'mobile':
-                processed_essences[essence_type] = f"Android SDK: {len(essence_data)} components"
-            elif essence_type == 'secure':
-                processed_essences[essence_type] = f"JCA/JCE: {len(essence_data)} secure ops"
-            elif essence_type == 'concurrent':
-                processed_essences[essence_type] = f"ExecutorService: {len(essence_data)} pools"
-            else:
-                processed_essences[essence_type] = f"java native: {len(essence_data)} operations"
-        
-        return {
-            'engine': self.name,
-            'level': 1,
-            'processed_essences': processed_essences,
-            'advantages': ['platform_independent', 'mature_ecosystem', 'enterprise_ready']
-        }
-    
-    def execute_level2(self, essences: Dict, context: Dict, **kwargs) -> Dict:
-        result = self.execute_level1(essences, context)
-        result.update({
-            'level': 2,
-            'optimization': 'JVM tuning + parallel GC',
-            'performance_mode': kwargs.get('priority', 'balanced')
-        })
-        return result
+    ENGINE_NAME = "java"
+    deterministic = True
+    ESSENCE_FORMATS = {
+        'mobile': "Android SDK: {} components",
+        'secure': "JCA/JCE: {} secure ops",
+        'concurrent': "ExecutorService: {} pools"
+    }
+    DEFAULT_FORMAT = "java native: {} operations"
+    ADVANTAGES = ['platform_independent', 'mature_ecosystem', 'enterprise_ready']
+    LEVEL2_OPTIMIZATION = 'JVM tuning + parallel GC'
 
 class CppEngine(BaseEngine):
-    def __init__(self):
-        super().__init__("cpp")
-    
-    def execute_level1(self, essences: Dict, context: Dict) -> Dict:
-        self.execution_count += 1
-        
-        processed_essences = {}
-        for essence_type, essence_data in essences.items():
-            if essence_type == 'concurrent':
-                processed_essences[essence_type] = f"std::thread: {len(essence_data)} parallel"
-            elif essence_type == 'own':
-                processed_essences[essence_type] = f"RAII + smart_ptr: {len(essence_data)} managed"
-            else:
-                processed_essences[essence_type] = f"cpp native: {len(essence_data)} operations"
-        
-        return {
-            'engine': self.name,
-            'level': 1,
-            'processed_essences': processed_essences,
-            'advantages': ['maximum_performance', 'system_control', 'zero_overhead']
-        }
-    
-    def execute_level2(self, essences: Dict, context: Dict, **kwargs) -> Dict:
-        result = self.execute_level1(essences, context)
-        result.update({
-            'level': 2,
-            'optimization': 'template metaprogramming + SIMD',
-            'performance_mode': kwargs.get('priority', 'balanced')
-        })
-        return result
+    ENGINE_NAME = "cpp"
+    deterministic = True
+    ESSENCE_FORMATS = {
+        'concurrent': "std::thread: {} parallel",
+        'own': "RAII + smart_ptr: {} managed"
+    }
+    DEFAULT_FORMAT = "cpp native: {} operations"
+    ADVANTAGES = ['maximum_performance', 'system_control', 'zero_overhead']
+    LEVEL2_OPTIMIZATION = 'template metaprogramming + SIMD'
 
 class TypeScriptEngine(BaseEngine):
-    def __init__(self):
-        super().__init__("typescript")
-    
-    def execute_level1(self, essences: Dict, context: Dict) -> Dict:
-        self.execution_count += 1
-        
-        processed_essences = {}
-        for essence_type, essence_data in essences.items():
-            if essence_type == 'event':
-                processed_essences[essence_type] = f"typed events: {len(essence_data)} listeners"
-            elif essence_type == 'mobile':
-                processed_essences[essence_type] = f"React Native: {len(essence_data)} components"
-            elif essence_type == 'api':
-                processed_essences[essence_type] = f"typed routes: {len(essence_data)} endpoints"
-            else:
-                processed_essences[essence_type] = f"typescript native: {len(essence_data)} ops"
-        
-        return {
-            'engine': self.name,
-            'level': 1,
-            'processed_essences': processed_essences,
-            'advantages': ['static_typing', 'modern_js_features', 'great_tooling']
-        }
-    
-    def execute_level2(self, essences: Dict, context: Dict, **kwargs) -> Dict:
-        result = self.execute_level1(essences, context)
-        result.update({
-            'level': 2,
-            'optimization': 'advanced types + tree-shaking',
-            'performance_mode': kwargs.get('priority', 'balanced')
-        })
-        return result
+    ENGINE_NAME = "typescript"
+    deterministic = True
+    ESSENCE_FORMATS = {
+        'event': "typed events: {} listeners",
+        'mobile': "React Native: {} components",
+        'api': "typed routes: {} endpoints"
+    }
+    DEFAULT_FORMAT = "typescript native: {} ops"
+    ADVANTAGES = ['static_typing', 'modern_js_features', 'great_tooling']
+    LEVEL2_OPTIMIZATION = 'advanced types + tree-shaking'
 
 # ===== CLI INTERFACE =====
+def _parse_address(value: str):
+    """HOST:PORT -> (host, port) tuple, anything else is a Unix socket path"""
+    host, sep, port = value.rpartition(':')
+    if sep and port.isdigit():
+        return (host or '127.0.0.1', int(port))
+    return value
+
 def main():
     """Enhanced CLI interface for ILN v2.0 GitHub Edition"""
     import argparse
@@ -759,12 +2786,76 @@ def main():
     parser.add_argument('--champion', default='auto', help='Champion for Level 3')
     parser.add_argument('--priority', default='balanced', 
                        choices=['performance', 'safety', 'reactive', 'balanced'])
+    parser.add_argument('--timeout', type=float, default=None, help='Execution budget in seconds')
     parser.add_argument('--api-key', help='API key for Pro features')
+    parser.add_argument('--worker', metavar='ADDRESS',
+                       help='Run as distributed worker for the coordinator at HOST:PORT or socket path '
+                            '(authkey from ILN_AUTHKEY)')
+    parser.add_argument('--distribute', metavar='FILE',
+                       help='Coordinate execution of FILE (one ILN program per line) across workers')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                       help='Local worker processes for --distribute')
+    parser.add_argument('--shard-size', type=int, default=1000, help='Programs per shard for --distribute')
+    parser.add_argument('--listen', metavar='ADDRESS', default='127.0.0.1:0',
+                       help='Coordinator listen address for --distribute (HOST:PORT or socket path)')
+    parser.add_argument('--profile', metavar='FILE',
+                       help='Sample ILN stages while running and write collapsed stacks (flamegraph input) to FILE')
+    parser.add_argument('--profile-rate', type=float, default=97.0, help='Profiler samples per second')
+    parser.add_argument('--profile-signal', action='store_true',
+                       help='Toggle profiling with SIGUSR2 (writes --profile FILE or iln-profile.collapsed)')
+    parser.add_argument('--log-json', action='store_true', help='Emit structured JSON log records')
+    parser.add_argument('--quiet-calls', action='store_true',
+                       help='Suppress per-call log records (aggregate counts are kept)')
     parser.add_argument('--demo', action='store_true', help='Run demo')
     parser.add_argument('--info', action='store_true', help='Show system info')
     
     args = parser.parse_args()
     
+    if args.log_json or args.quiet_calls:
+        configure_logging(structured=args.log_json, per_call=not args.quiet_calls)
+    
+    PROFILER.sample_rate = args.profile_rate
+    if args.profile_signal and hasattr(signal, 'SIGUSR2'):
+        PROFILER.install_signal_toggle(args.profile or 'iln-profile.collapsed')
+    if args.profile:
+        PROFILER.start()
+    try:
+        _run_cli(args)
+    finally:
+        if args.profile and PROFILER.active:
+            PROFILER.stop()
+            PROFILER.write_collapsed(args.profile)
+
+def _run_cli(args):
+    """Dispatch parsed CLI arguments"""
+    if args.worker:
+        run_worker(_parse_address(args.worker), os.environ.get('ILN_AUTHKEY', '').encode() or None,
+                   api_key=args.api_key)
+        return
+    
+    if args.distribute:
+        with open(args.distribute, encoding='utf-8') as f:
+            programs = [line.rstrip('\n') for line in f if line.strip()]
+        authkey = os.environ.get('ILN_AUTHKEY', '').encode() or None
+        coordinator = ILNCoordinator(address=_parse_address(args.listen), authkey=authkey,
+                                     shard_size=args.shard_size, api_key=args.api_key)
+        options = {'level': args.level, 'engine': args.engine, 'priority': args.priority,
+                   'context': {'priority': args.priority}, 'timeout': args.timeout}
+        report = coordinator.run(programs, local_workers=args.workers,
+                                 on_listening=lambda address: print(f"📡 Coordinator listening on {address}"),
+                                 **options)
+        print(json.dumps({
+            'programs': len(report.results),
+            'succeeded': sum(1 for result in report.results if result.success),
+            'shards': report.shards,
+            'failed_shards': report.failed_shards,
+            'retries': report.retries,
+            'elapsed': report.elapsed,
+            'throughput': report.throughput,
+            'programs_per_worker': report.programs_per_worker
+        }, indent=2))
+        return
+    
     iln = ILN(api_key=args.api_key)
     
     if args.demo:
@@ -789,10 +2880,11 @@ def main():
     # Execute code
     context = {'priority': args.priority}
     if args.level == 3:
-        result = iln.execute(args.code, level=args.level, champion=args.champion, context=context)
+        result = iln.execute(args.code, level=args.level, champion=args.champion, context=context,
+                             timeout=args.timeout)
     else:
         result = iln.execute(args.code, level=args.level, engine=args.engine, 
-                           priority=args.priority, context=context)
+                           priority=args.priority, context=context, timeout=args.timeout)
     
     if result.success:
         print(f"✅ Success! Level {result.level}")
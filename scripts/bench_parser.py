@@ -0,0 +1,125 @@
+# scripts/bench_parser.py
+"""Adversarial benchmark for the essence parser.
+
+Times EssenceProcessor.parse_essences on pathological inputs of doubling size
+and checks that the worst case stays proportional to input length. A random
+fuzz pass under tight limits checks every parse either matches the original
+unbounded patterns or is rejected.
+
+Usage: python scripts/bench_parser.py [--max-size 1000000] [--fuzz 2000]
+"""
+import os
+import re
+import sys
+import time
+import random
+import argparse
+from dataclasses import replace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from iln import EssenceProcessor, ILNInputError, ParseLimits  # noqa: E402
+
+# Each generator returns an input of roughly `size` characters
+ADVERSARIAL_INPUTS = {
+    'unclosed_args': lambda size: "chan!('a', " + "x" * size,
+    'repeated_unclosed': lambda size: "chan!('a', " * (size // 11),
+    'unclosed_label': lambda size: "own!('" * (size // 6),
+    'whitespace_flood': lambda size: ("event!" + " " * 1000) * (size // 1006),
+    'all_keywords_open': lambda size: "".join(
+        f"{name}!( '" for name in EssenceProcessor.BUILTIN_ESSENCES
+    ) * (size // 80),
+    'benign': lambda size: "chan!('jobs', 10) ml!('model', cnn) " * (size // 36),
+}
+
+def time_parse(code, repeat=3):
+    """Best-of-`repeat` wall time for one parse"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            EssenceProcessor.parse_essences(code)
+        except ILNInputError:
+            pass
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run_scaling(max_size, tolerance):
+    """Time every adversarial input at doubling sizes; True when growth stays linear"""
+    sizes = []
+    size = max_size
+    while size >= 16_000 and len(sizes) < 5:
+        sizes.insert(0, size)
+        size //= 2
+
+    linear = True
+    print(f"{'input':<20}" + "".join(f"{s:>12,}" for s in sizes) + f"{'ns/char':>10}{'growth':>9}")
+    for name, generate in ADVERSARIAL_INPUTS.items():
+        timings = []
+        for size in sizes:
+            code = generate(size)
+            timings.append((len(code), time_parse(code)))
+        per_char = [t / max(n, 1) for n, t in timings]
+        # Cost per character at the largest size relative to the smallest
+        growth = per_char[-1] / per_char[0] if per_char[0] else 1.0
+        linear &= growth <= tolerance
+        print(f"{name:<20}" + "".join(f"{t * 1000:>10.2f}ms" for _, t in timings)
+              + f"{per_char[-1] * 1e9:>10.1f}{growth:>8.2f}x")
+    return linear
+
+# The original unbounded patterns: the reference a bounded parse must agree with
+LEGACY_TEMPLATE = r"{keyword}!\s*\(\s*['\"]([^'\"]+)['\"],\s*([^)]+)\)"
+
+def run_fuzz(iterations, seed):
+    """Random inputs from essence fragments under tight limits
+    
+    Every parse must either equal the legacy findall result or raise ILNInputError;
+    a differing result means an over-limit essence was silently dropped or altered.
+    """
+    saved = EssenceProcessor.PARSE_LIMITS
+    limits = ParseLimits(max_label_length=8, max_args_length=16, max_whitespace=4)
+    EssenceProcessor.set_parse_limits(limits)
+    rng = random.Random(seed)
+    fragments = ["!", "(", ")", "'", '"', ",", " ", "\n", "a", "x1", "!(", "('", "', ",
+                 " " * 6, "word" * 3, "y" * 20]
+    fragments += [f"{name}!" for name in EssenceProcessor.BUILTIN_ESSENCES]
+    legacy = {name: re.compile(LEGACY_TEMPLATE.format(keyword=re.escape(name)), re.IGNORECASE)
+              for name in EssenceProcessor.BUILTIN_ESSENCES}
+    mismatches = rejected = 0
+    try:
+        for _ in range(iterations):
+            code = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 60)))
+            expected = {name: found for name, pattern in legacy.items() if (found := pattern.findall(code))}
+            try:
+                parsed = dict(EssenceProcessor.parse_essences(code))
+            except ILNInputError:
+                rejected += 1
+                continue
+            if parsed != expected:
+                mismatches += 1
+    finally:
+        EssenceProcessor.set_parse_limits(saved)
+    print(f"fuzz: {iterations} inputs under {limits}, {rejected} rejected, {mismatches} mismatches")
+    return mismatches == 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Essence parser adversarial benchmark")
+    parser.add_argument('--max-size', type=int, default=1_000_000, help='Largest input size in characters')
+    parser.add_argument('--tolerance', type=float, default=3.0,
+                        help='Maximum allowed growth of time per character across sizes')
+    parser.add_argument('--fuzz', type=int, default=2000, help='Random fuzz iterations (0 to skip)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    # Lift the size and count caps so the timings measure scanning, not early rejection
+    EssenceProcessor.set_parse_limits(replace(EssenceProcessor.PARSE_LIMITS,
+                                              max_input_length=args.max_size * 2,
+                                              max_essences=args.max_size))
+    print(f"limits: {EssenceProcessor.PARSE_LIMITS}")
+    linear = run_scaling(args.max_size, args.tolerance)
+    fuzz_ok = run_fuzz(args.fuzz, args.seed) if args.fuzz else True
+    print("✅ worst case linear in input length" if linear else "❌ super-linear growth detected")
+    sys.exit(0 if linear and fuzz_ok else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+# scripts/load_test.py
+"""Load generator replaying a production-like request mix against ILN.
+
+Requests are issued open-loop at a target rate against one entry point
+(ILN.execute, ILN.execute_async, ILNScheduler or the CLI). Latency is measured
+from each request's intended send time, so a stalled system is not hidden by
+the generator slowing down (coordinated omission). Writes a JSON report and an
+HDR-style percentile distribution (.hgrm).
+
+Usage:
+    python scripts/load_test.py --entry execute --rate 500 --duration 30 \\
+        --levels 1:0.6,2:0.3,3:0.05,4:0.05 --duplicate-ratio 0.2 --report report.json
+    python scripts/load_test.py --mix mix.json --entry scheduler
+"""
+import os
+import sys
+import json
+import math
+import time
+import random
+import asyncio
+import argparse
+import threading
+import subprocess
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ILN_PATH = os.path.join(SCRIPT_DIR, '..', 'iln.py')
+sys.path.insert(0, os.path.join(SCRIPT_DIR, '..'))
+
+from iln import ILN, ILNScheduler, EssenceProcessor, ResultCache, SingleFlight, configure_logging  # noqa: E402
+
+ENTRY_POINTS = ('execute', 'async', 'scheduler', 'cli')
+
+@dataclass
+class RequestMix:
+    """Weighted distributions the generated requests are drawn from"""
+    levels: dict = field(default_factory=lambda: {1: 0.6, 2: 0.3, 3: 0.05, 4: 0.05})
+    priorities: dict = field(default_factory=lambda: {'balanced': 0.5, 'performance': 0.2,
+                                                      'safety': 0.15, 'reactive': 0.15})
+    engines: dict = field(default_factory=lambda: {'auto': 0.8, 'go': 0.05, 'rust': 0.05,
+                                                   'python': 0.05, 'nodejs': 0.05})
+    essence_counts: dict = field(default_factory=lambda: {1: 0.3, 2: 0.3, 4: 0.25, 8: 0.1, 32: 0.05})
+    arg_length: int = 24
+    duplicate_ratio: float = 0.1
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for key in ('levels', 'essence_counts'):
+            if key in data:
+                data[key] = {int(k): v for k, v in data[key].items()}
+        return cls(**data)
+
+def parse_weights(value, key_type=str):
+    """'1:0.6,2:0.4' -> {1: 0.6, 2: 0.4}"""
+    weights = {}
+    for item in value.split(','):
+        key, _, weight = item.partition(':')
+        weights[key_type(key.strip())] = float(weight or 1)
+    return weights
+
+class RequestGenerator:
+    """Draws (code, level, engine, priority) tuples from a RequestMix"""
+
+    def __init__(self, mix: RequestMix, seed: int = 0):
+        self.mix = mix
+        self.rng = random.Random(seed)
+        self.essences = EssenceProcessor.BUILTIN_ESSENCES
+        self.recent = deque(maxlen=256)
+
+    def _choice(self, weights):
+        return self.rng.choices(list(weights), weights=list(weights.values()))[0]
+
+    def _program(self):
+        count = self._choice(self.mix.essence_counts)
+        parts = []
+        for index in range(count):
+            name = self.rng.choice(self.essences)
+            length = max(1, int(self.rng.expovariate(1 / self.mix.arg_length)))
+            argument = "".join(self.rng.choice("abcdefghijklmnopqrstuvwxyz_") for _ in range(length))
+            parts.append(f"{name}!('{name}{index}', {argument})")
+        return " && ".join(parts)
+
+    def next(self):
+        if self.recent and self.rng.random() < self.mix.duplicate_ratio:
+            return self.rng.choice(self.recent)
+        request = (self._program(), self._choice(self.mix.levels),
+                   self._choice(self.mix.engines), self._choice(self.mix.priorities))
+        self.recent.append(request)
+        return request
+
+class LatencyHistogram:
+    """HDR-style log-linear histogram of integer microsecond values
+
+    Values below 2**precision_bits are exact; above that each power of two is
+    split into 2**(precision_bits - 1) buckets, bounding relative error to
+    2**-(precision_bits - 1).
+    """
+
+    def __init__(self, precision_bits: int = 8):
+        self.bits = precision_bits
+        self.sub_buckets = 1 << precision_bits
+        self.half = self.sub_buckets >> 1
+        self.counts = defaultdict(int)
+        self.total = 0
+        self.sum = 0
+        self.sum_squares = 0
+        self.max = 0
+        self._lock = threading.Lock()
+
+    def _index(self, value):
+        if value < self.sub_buckets:
+            return value
+        shift = value.bit_length() - self.bits
+        return self.sub_buckets + (shift - 1) * self.half + ((value >> shift) - self.half)
+
+    def _highest_equivalent(self, index):
+        if index < self.sub_buckets:
+            return index
+        shift, offset = divmod(index - self.sub_buckets, self.half)
+        shift += 1
+        return ((offset + self.half + 1) << shift) - 1
+
+    def record(self, seconds):
+        value = max(0, int(seconds * 1e6))
+        with self._lock:
+            self.counts[self._index(value)] += 1
+            self.total += 1
+            self.sum += value
+            self.sum_squares += value * value
+            self.max = max(self.max, value)
+
+    def value_at(self, percentile):
+        """Microsecond value at `percentile` (0-100)"""
+        if not self.total:
+            return 0
+        target = max(1, math.ceil(self.total * percentile / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._highest_equivalent(index), self.max)
+        return self.max
+
+    def summary_ms(self):
+        mean = self.sum / self.total if self.total else 0.0
+        summary = {f"p{label}": self.value_at(percentile) / 1000
+                   for label, percentile in (('50', 50), ('95', 95), ('99', 99), ('999', 99.9))}
+        summary.update(mean=mean / 1000, max=self.max / 1000)
+        return summary
+
+    def write_hgrm(self, path, ticks_per_half=5):
+        """Percentile distribution in HdrHistogram's text (.hgrm) layout, values in ms"""
+        mean = self.sum / self.total if self.total else 0.0
+        stddev = max(0.0, self.sum_squares / self.total - mean * mean) ** 0.5 if self.total else 0.0
+        percentiles = []
+        for half in range(20):
+            low, high = 1 - 0.5 ** half, 1 - 0.5 ** (half + 1)
+            percentiles.extend(low + (high - low) * tick / ticks_per_half for tick in range(ticks_per_half))
+        percentiles.append(1.0)
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"{'Value':>12} {'Percentile':>14} {'TotalCount':>10} {'1/(1-Percentile)':>16}\n\n")
+            for percentile in percentiles:
+                value = self.value_at(percentile * 100)
+                count = min(self.total, math.ceil(self.total * percentile))
+                inverse = f"{1 / (1 - percentile):>16.2f}" if percentile < 1 else f"{'inf':>16}"
+                f.write(f"{value / 1000:>12.3f} {percentile:>14.12f} {count:>10} {inverse}\n")
+            f.write(f"#[Mean    = {mean / 1000:>12.3f}, StdDeviation   = {stddev / 1000:>12.3f}]\n")
+            f.write(f"#[Max     = {self.max / 1000:>12.3f}, Total count    = {self.total:>12}]\n")
+            f.write(f"#[Buckets = {len(self.counts):>12}, SubBuckets     = {self.sub_buckets:>12}]\n")
+
+class LoadRunner:
+    """Issues requests at a fixed rate against one entry point and records outcomes"""
+
+    def __init__(self, entry: str, iln: ILN, concurrency: int, api_key: str = None, timeout: float = None):
+        self.entry = entry
+        self.iln = iln
+        self.api_key = api_key
+        self.timeout = timeout
+        self.latency = LatencyHistogram()
+        self.service_time = LatencyHistogram()
+        self.outcomes = defaultdict(int)
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='load')
+        self._scheduler = ILNScheduler(iln, workers=concurrency) if entry == 'scheduler' else None
+        self._loop = None
+        if entry == 'async':
+            self._loop = asyncio.new_event_loop()
+            self._loop.set_default_executor(ThreadPoolExecutor(max_workers=concurrency))
+            threading.Thread(target=self._loop.run_forever, name='load-async', daemon=True).start()
+
+    def _record(self, intended, started, outcome):
+        finished = time.perf_counter()
+        self.latency.record(finished - intended)
+        self.service_time.record(finished - started)
+        with self._lock:
+            self.outcomes[outcome] += 1
+
+    @staticmethod
+    def _outcome(result):
+        if result.success:
+            return 'ok'
+        return (result.metadata or {}).get('error_type', 'error')
+
+    def _kwargs(self, engine, priority):
+        return {'engine': engine, 'context': {'priority': priority}, 'timeout': self.timeout}
+
+    def _call_execute(self, request, intended):
+        code, level, engine, priority = request
+        started = time.perf_counter()
+        try:
+            outcome = self._outcome(self.iln.execute(code, level=level, **self._kwargs(engine, priority)))
+        except Exception as e:
+            outcome = type(e).__name__
+        self._record(intended, started, outcome)
+
+    def _call_cli(self, request, intended):
+        code, level, engine, priority = request
+        command = [sys.executable, ILN_PATH, code, '--level', str(level), '--engine', engine,
+                   '--priority', priority, '--quiet-calls']
+        if self.api_key:
+            command += ['--api-key', self.api_key]
+        if self.timeout is not None:
+            command += ['--timeout', str(self.timeout)]
+        started = time.perf_counter()
+        try:
+            completed = subprocess.run(command, capture_output=True, text=True, timeout=60)
+            outcome = 'ok' if '✅' in completed.stdout else 'error'
+        except subprocess.TimeoutExpired:
+            outcome = 'cli_timeout'
+        self._record(intended, started, outcome)
+
+    def _dispatch(self, request, intended):
+        code, level, engine, priority = request
+        if self.entry == 'execute':
+            return self._pool.submit(self._call_execute, request, intended)
+        if self.entry == 'cli':
+            return self._pool.submit(self._call_cli, request, intended)
+
+        started = time.perf_counter()
+
+        def done(future):
+            try:
+                outcome = self._outcome(future.result())
+            except Exception as e:
+                outcome = type(e).__name__
+            self._record(intended, started, outcome)
+
+        if self.entry == 'scheduler':
+            future = self._scheduler.submit(code, level=level, priority=priority,
+                                            **self._kwargs(engine, priority))
+        else:
+            future = asyncio.run_coroutine_threadsafe(
+                self.iln.execute_async(code, level, **self._kwargs(engine, priority)), self._loop
+            )
+        future.add_done_callback(done)
+        return future
+
+    def run(self, requests, rate):
+        """Send `requests` at `rate` per second; returns wall-clock seconds until all completed"""
+        futures = []
+        start = time.perf_counter()
+        for index, request in enumerate(requests):
+            intended = start + index / rate
+            delay = intended - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            futures.append(self._dispatch(request, intended))
+        for future in futures:
+            try:
+                future.result()
+            except Exception:
+                pass  # already recorded by the done callback
+        elapsed = time.perf_counter() - start
+        self.close()
+        return elapsed
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+        if self._scheduler is not None:
+            self._scheduler.shutdown()
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+def _usage():
+    """(user_cpu, system_cpu, peak_rss_mb) for this process and, separately, its children"""
+    if resource is None:
+        return None
+    usage = {}
+    for scope, who in (('self', resource.RUSAGE_SELF), ('children', resource.RUSAGE_CHILDREN)):
+        r = resource.getrusage(who)
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+        usage[scope] = (r.ru_utime, r.ru_stime, r.ru_maxrss / divisor)
+    return usage
+
+def main():
+    parser = argparse.ArgumentParser(description="ILN load generator")
+    parser.add_argument('--entry', choices=ENTRY_POINTS, default='execute', help='Entry point under test')
+    parser.add_argument('--rate', type=float, default=200.0, help='Target requests per second')
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds of traffic to generate')
+    parser.add_argument('--concurrency', type=int, default=16, help='Client threads / scheduler workers')
+    parser.add_argument('--mix', metavar='FILE', help='JSON RequestMix (overrides the mix flags)')
+    parser.add_argument('--levels', help='Level weights, e.g. 1:0.6,2:0.3,3:0.05,4:0.05')
+    parser.add_argument('--priorities', help='Priority weights, e.g. balanced:0.5,performance:0.5')
+    parser.add_argument('--engines', help='Engine weights, e.g. auto:0.8,go:0.2')
+    parser.add_argument('--essence-counts', help='Essences-per-program weights, e.g. 1:0.5,8:0.5')
+    parser.add_argument('--arg-length', type=int, help='Mean essence argument length in characters')
+    parser.add_argument('--duplicate-ratio', type=float, help='Share of requests repeating a recent one')
+    parser.add_argument('--api-key', default=os.getenv('ILN_API_KEY', 'load-test'),
+                        help='API key enabling Levels 3-4 (default: ILN_API_KEY or a local placeholder)')
+    parser.add_argument('--timeout', type=float, default=None, help='Per-request execution budget in seconds')
+    parser.add_argument('--result-cache', action='store_true', help='Enable the engine result cache')
+    parser.add_argument('--single-flight', action='store_true', help='Coalesce identical in-flight requests')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--report', default='load-report.json', help='JSON report path')
+    parser.add_argument('--histogram', default='load-latency.hgrm', help='HDR percentile distribution path')
+    args = parser.parse_args()
+
+    mix = RequestMix.from_file(args.mix) if args.mix else RequestMix()
+    if not args.mix:
+        if args.levels:
+            mix.levels = parse_weights(args.levels, int)
+        if args.priorities:
+            mix.priorities = parse_weights(args.priorities)
+        if args.engines:
+            mix.engines = parse_weights(args.engines)
+        if args.essence_counts:
+            mix.essence_counts = parse_weights(args.essence_counts, int)
+        if args.arg_length is not None:
+            mix.arg_length = args.arg_length
+        if args.duplicate_ratio is not None:
+            mix.duplicate_ratio = args.duplicate_ratio
+
+    configure_logging(per_call=False)
+    iln = ILN(api_key=args.api_key,
+              result_cache=ResultCache() if args.result_cache else None,
+              single_flight=SingleFlight() if args.single_flight else None)
+    generator = RequestGenerator(mix, args.seed)
+    requests = [generator.next() for _ in range(max(1, int(args.rate * args.duration)))]
+
+    print(f"🚀 {len(requests)} requests at {args.rate:g}/s against '{args.entry}' "
+          f"(concurrency {args.concurrency})")
+    runner = LoadRunner(args.entry, iln, args.concurrency, api_key=args.api_key, timeout=args.timeout)
+    before = _usage()
+    wall_start = time.perf_counter()
+    elapsed = runner.run(requests, args.rate)
+    wall = time.perf_counter() - wall_start
+    after = _usage()
+
+    report = {
+        'entry': args.entry,
+        'mix': asdict(mix),
+        'target_rate': args.rate,
+        'concurrency': args.concurrency,
+        'requests': len(requests),
+        'outcomes': dict(runner.outcomes),
+        'elapsed_s': elapsed,
+        'throughput_rps': len(requests) / elapsed if elapsed else 0.0,
+        'latency_ms': runner.latency.summary_ms(),
+        'service_time_ms': runner.service_time.summary_ms(),
+        'iln_metrics': iln.get_metrics(),
+    }
+    if before is not None:
+        cpu = {scope: (after[scope][0] - before[scope][0]) + (after[scope][1] - before[scope][1])
+               for scope in after}
+        report['cpu'] = {
+            'self_s': cpu['self'],
+            'children_s': cpu['children'],
+            'utilization': (cpu['self'] + cpu['children']) / wall if wall else 0.0,
+        }
+        report['peak_rss_mb'] = {'self': after['self'][2], 'children': after['children'][2]}
+
+    with open(args.report, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, default=str)
+    runner.latency.write_hgrm(args.histogram)
+
+    latency = report['latency_ms']
+    print(f"📊 {report['throughput_rps']:.1f} req/s | p50 {latency['p50']:.2f}ms p95 {latency['p95']:.2f}ms "
+          f"p99 {latency['p99']:.2f}ms p999 {latency['p999']:.2f}ms | outcomes {report['outcomes']}")
+    print(f"✨ Report: {args.report}, histogram: {args.histogram}")
+
+if __name__ == "__main__":
+    main()
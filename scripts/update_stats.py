@@ -1,36 +1,102 @@
-
 # scripts/update_stats.py
 import os
 import re
+import json
+import argparse
+import threading
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Les variables sont définies à l'intérieur de ce script,
 # car il sera exécuté indépendamment par GitHub Actions.
 REPO_NAME = "Tryboy869/iln-nexus"
 README_PATH = "README.md"
+CACHE_PATH = os.path.join(".github", "stats-cache.json")
+API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+REQUEST_TIMEOUT = 10
+
+STATS_PATTERN = re.compile(r"(?s)<!-- START_STATS -->.*?<!-- END_STATS -->")
+TIMESTAMP_PATTERN = re.compile(r"(?m)^\*Dernière mise à jour : .*\*$")
+
+class ETagCache:
+    """Cache disque des réponses de l'API, indexé par URL (ETag + données)."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._dirty = False
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
 
-def get_repo_stats(repo_name):
-    """Récupère les stats via l'API GitHub."""
+    def get(self, url):
+        with self._lock:
+            return self._entries.get(url)
+
+    def put(self, url, etag, data):
+        with self._lock:
+            self._entries[url] = {"etag": etag, "data": data}
+            self._dirty = True
+
+    def save(self):
+        """Écriture atomique, uniquement si une entrée a changé."""
+        with self._lock:
+            if not self._dirty:
+                return
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+
+def make_session(pool_size):
+    """Session HTTP partagée : connexions réutilisées et réessais sur erreurs transitoires."""
+    session = requests.Session()
+    token = os.getenv('GITHUB_TOKEN')
+    if token:
+        session.headers['Authorization'] = f'token {token}'
+    session.headers['Accept'] = 'application/vnd.github+json'
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504),
+                  allowed_methods=frozenset({'GET'}))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def get_repo_stats(repo_name, session, cache, api_url=API_URL, timeout=REQUEST_TIMEOUT):
+    """Récupère les stats via l'API GitHub (requête conditionnelle If-None-Match)."""
+    url = f"{api_url.rstrip('/')}/repos/{repo_name}"
+    cached = cache.get(url)
     try:
-        token = os.getenv('GITHUB_TOKEN')
-        headers = {'Authorization': f'token {token}'} if token else {}
-        response = requests.get(f"https://api.github.com/repos/{repo_name}", headers=headers)
+        headers = {'If-None-Match': cached['etag']} if cached and cached.get('etag') else {}
+        response = session.get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and cached:
+            return cached['data']
         response.raise_for_status()
         data = response.json()
-        return {
+        stats = {
             "stars": data.get("stargazers_count", 0),
             "last_commit_date": data.get("pushed_at", "N/A"),
         }
+        cache.put(url, response.headers.get('ETag'), stats)
+        return stats
     except Exception as e:
-        print(f"Could not fetch real GitHub stats: {e}")
+        print(f"Could not fetch real GitHub stats for {repo_name}: {e}")
+        if cached:
+            return cached['data']
         return {"stars": "N/A", "last_commit_date": "N/A"}
 
-def update_readme(stats):
-    """Injecte les statistiques dans le README.md."""
-    with open(README_PATH, "r", encoding="utf-8") as f:
-        content = f.read()
-
+def render_stats_block(repo_name, stats, updated_at):
+    """Bloc Markdown des statistiques d'un dépôt."""
     last_commit_str = "N/A"
     if stats['last_commit_date'] != 'N/A':
         try:
@@ -39,26 +105,74 @@ def update_readme(stats):
         except ValueError:
             last_commit_str = stats['last_commit_date']
 
-    # Notez l'utilisation de f-strings ici, qui seront évaluées lorsque ce script s'exécutera.
-    stats_block = f"""
-*Dernière mise à jour : {datetime.utcnow().strftime('%d %B %Y, %H:%M:%S UTC')}*
-* **Révolutionnaires (Stars) :** [![GitHub Stars](https://img.shields.io/github/stars/{REPO_NAME}?style=social)](https://github.com/{REPO_NAME}/stargazers)
-* **Dernier Commit :** [![Last Commit](https://img.shields.io/github/last-commit/{REPO_NAME}?style=flat-square&color=blueviolet&label={last_commit_str})](https://github.com/{REPO_NAME}/commits/main)
-* **Build Status :** [![Build Status](https://img.shields.io/github/actions/workflow/status/{REPO_NAME}/update_readme.yml?style=flat-square&label=README%20Status)](https://github.com/{REPO_NAME}/actions)
+    return f"""
+*Dernière mise à jour : {updated_at.strftime('%d %B %Y, %H:%M:%S UTC')}*
+* **Révolutionnaires (Stars) :** [![GitHub Stars](https://img.shields.io/github/stars/{repo_name}?style=social)](https://github.com/{repo_name}/stargazers)
+* **Dernier Commit :** [![Last Commit](https://img.shields.io/github/last-commit/{repo_name}?style=flat-square&color=blueviolet&label={last_commit_str})](https://github.com/{repo_name}/commits/main)
+* **Build Status :** [![Build Status](https://img.shields.io/github/actions/workflow/status/{repo_name}/update_readme.yml?style=flat-square&label=README%20Status)](https://github.com/{repo_name}/actions)
 """
 
-    new_content = re.sub(
-        r"(?s)<!-- START_STATS -->.*?<!-- END_STATS -->",
-        f"<!-- START_STATS -->\n{stats_block}\n<!-- END_STATS -->",
-        content,
-    )
+def update_readme(readme_path, stats_block):
+    """Injecte les statistiques dans le README ; retourne False si rien n'a changé."""
+    with open(readme_path, "r", encoding="utf-8") as f:
+        content = f.read()
 
-    with open(README_PATH, "w", encoding="utf-8") as f:
+    current = STATS_PATTERN.search(content)
+    # L'horodatage change à chaque exécution : on l'ignore pour détecter un vrai changement.
+    if current is None or (TIMESTAMP_PATTERN.sub('', current.group(0))
+                           == TIMESTAMP_PATTERN.sub('', f"<!-- START_STATS -->\n{stats_block}\n<!-- END_STATS -->")):
+        print(f"⏭️  {readme_path} inchangé.")
+        return False
+
+    new_content = STATS_PATTERN.sub(
+        lambda _: f"<!-- START_STATS -->\n{stats_block}\n<!-- END_STATS -->", content, count=1
+    )
+    with open(readme_path, "w", encoding="utf-8") as f:
         f.write(new_content)
-    print("✅ README.md a été mis à jour avec les nouvelles statistiques.")
+    print(f"✅ {readme_path} a été mis à jour avec les nouvelles statistiques.")
+    return True
+
+def parse_targets(values, default_readme):
+    """`owner/repo` ou `owner/repo=chemin/README.md` -> liste ordonnée de (repo, readme)."""
+    targets = []
+    for value in values or [REPO_NAME]:
+        repo, _, readme = value.partition('=')
+        targets.append((repo.strip(), readme.strip() or default_readme))
+    return targets
+
+def main():
+    parser = argparse.ArgumentParser(description="Met à jour le bloc de statistiques des README")
+    parser.add_argument('repos', nargs='*', metavar='REPO[=README]',
+                        help=f"Dépôts à traiter (défaut : {REPO_NAME}={README_PATH})")
+    parser.add_argument('--readme', default=README_PATH, help='README des dépôts sans chemin explicite')
+    parser.add_argument('--cache', default=CACHE_PATH, help='Fichier de cache ETag')
+    parser.add_argument('--api-url', default=API_URL, help='URL de base de l\'API (GITHUB_API_URL)')
+    parser.add_argument('--workers', type=int, default=8, help='Requêtes simultanées')
+    parser.add_argument('--timeout', type=float, default=REQUEST_TIMEOUT, help='Délai par requête (s)')
+    args = parser.parse_args()
+
+    targets = parse_targets(args.repos, args.readme)
+    repos = list(dict.fromkeys(repo for repo, _ in targets))
+    cache = ETagCache(args.cache)
+    session = make_session(args.workers)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(args.workers, len(repos)))) as pool:
+            stats = dict(zip(repos, pool.map(
+                lambda repo: get_repo_stats(repo, session, cache, args.api_url, args.timeout), repos
+            )))
+    finally:
+        session.close()
+    cache.save()
+
+    # Plusieurs dépôts peuvent partager un même README : leurs blocs sont concaténés.
+    updated_at = datetime.utcnow()
+    blocks = {}
+    for repo, readme in targets:
+        blocks.setdefault(readme, []).append(render_stats_block(repo, stats[repo], updated_at))
+    for readme, readme_blocks in blocks.items():
+        update_readme(readme, "".join(readme_blocks))
 
 if __name__ == "__main__":
     print("🚀 Lancement du script de mise à jour du README...")
-    repo_stats = get_repo_stats(REPO_NAME)
-    update_readme(repo_stats)
+    main()
     print("✨ Processus terminé.")
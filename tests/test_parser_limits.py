@@ -0,0 +1,90 @@
+"""Essence parser limits: over-limit calls are rejected, never silently dropped"""
+import os
+import re
+import sys
+import random
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from iln import ILN, EssenceProcessor, ILNInputError, ParseLimits  # noqa: E402
+
+# The original unbounded patterns, the reference a bounded parse must agree with
+LEGACY_TEMPLATE = r"{keyword}!\s*\(\s*['\"]([^'\"]+)['\"],\s*([^)]+)\)"
+
+class ParserLimitsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.saved = EssenceProcessor.PARSE_LIMITS
+
+    def tearDown(self):
+        EssenceProcessor.set_parse_limits(self.saved)
+
+    def use_limits(self, **limits):
+        EssenceProcessor.set_parse_limits(ParseLimits(**limits))
+
+    def test_execute_rejects_over_limit_arguments(self):
+        result = ILN().execute("chan!('a', " + 'x' * 2000 + ')')
+        self.assertFalse(result.success)
+        self.assertEqual(result.metadata['error_type'], 'input_rejected')
+        self.assertEqual(result.metadata['limit'], 'max_args_length')
+
+    def test_execute_rejects_non_string_input(self):
+        self.assertFalse(ILN().execute(None).success)
+
+    def test_overflow_limits(self):
+        self.use_limits(max_label_length=8, max_args_length=16, max_whitespace=4)
+        cases = {
+            "own!('" + 'l' * 9 + "', x)": 'max_label_length',
+            "own!('ok', " + 'a' * 17 + ')': 'max_args_length',
+            "own!" + ' ' * 5 + "('ok', x)": 'max_whitespace',
+            "own!('ok'," + ' ' * 5 + 'x)': 'max_whitespace',
+        }
+        for code, limit in cases.items():
+            with self.assertRaises(ILNInputError) as raised:
+                EssenceProcessor.parse_essences(code)
+            self.assertEqual(raised.exception.limit, limit, code)
+        self.assertEqual(EssenceProcessor.parse_essences("own!('l' , x)"), {})
+        self.assertEqual(EssenceProcessor.parse_essences("own!('" + 'l' * 8 + "', " + 'a' * 16 + ')'),
+                         {'own': [('l' * 8, 'a' * 16)]})
+
+    def test_hit_nested_in_a_match_is_accepted(self):
+        code = "chan!('a', x chan!('" + 'q' * 300 + "') )"
+        self.assertEqual(EssenceProcessor.parse_essences(code), {'chan': [('a', "x chan!('" + 'q' * 300 + "'")]})
+        with self.assertRaises(ILNInputError):
+            EssenceProcessor.parse_essences(code + " chan!('" + 'q' * 300 + "', x)")
+
+    def test_count_and_size_caps(self):
+        self.use_limits(max_input_length=100, max_essences=3)
+        self.assertEqual(len(EssenceProcessor.parse_essences("ml!('a', 1) " * 3)['ml']), 3)
+        with self.assertRaises(ILNInputError) as raised:
+            EssenceProcessor.parse_essences("ml!('a', 1) " * 4)
+        self.assertEqual(raised.exception.limit, 'max_essences')
+        with self.assertRaises(ILNInputError) as raised:
+            EssenceProcessor.parse_essences('x' * 101)
+        self.assertEqual(raised.exception.limit, 'max_input_length')
+        with self.assertRaises(ILNInputError):
+            EssenceProcessor.check_input('x' * 101)
+
+    def test_fuzz_matches_legacy_or_rejects(self):
+        self.use_limits(max_label_length=8, max_args_length=16, max_whitespace=4)
+        rng = random.Random(0)
+        fragments = ["!", "(", ")", "'", '"', ",", " ", "\n", "a", "x1", "!(", "('", "', ",
+                     " " * 6, "word" * 3, "y" * 20]
+        fragments += [f"{name}!" for name in EssenceProcessor.BUILTIN_ESSENCES]
+        legacy = {name: re.compile(LEGACY_TEMPLATE.format(keyword=re.escape(name)), re.IGNORECASE)
+                  for name in EssenceProcessor.BUILTIN_ESSENCES}
+        parsed_count = 0
+        for _ in range(1000):
+            code = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 60)))
+            expected = {name: found for name, pattern in legacy.items() if (found := pattern.findall(code))}
+            try:
+                parsed = dict(EssenceProcessor.parse_essences(code))
+            except ILNInputError:
+                continue
+            parsed_count += 1
+            self.assertEqual(parsed, expected, code)
+        self.assertGreater(parsed_count, 0)
+
+if __name__ == '__main__':
+    unittest.main()
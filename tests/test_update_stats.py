@@ -0,0 +1,116 @@
+"""scripts/update_stats.py against a local stub of the GitHub API"""
+import os
+import json
+import tempfile
+import threading
+import unittest
+import importlib.util
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'update_stats.py')
+spec = importlib.util.spec_from_file_location('update_stats', SCRIPT)
+update_stats = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(update_stats)
+
+REPO = {"stargazers_count": 42, "pushed_at": "2026-10-01T10:00:00Z"}
+
+class StubGitHub(BaseHTTPRequestHandler):
+    """GET /repos/<name>: 200 with an ETag, 304 when If-None-Match matches, or a forced status"""
+
+    etag = '"v1"'
+    status = None
+    requests = []
+
+    def do_GET(self):
+        type(self).requests.append((self.path, self.headers.get('If-None-Match')))
+        if self.status is not None:
+            self.send_response(self.status)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if self.headers.get('If-None-Match') == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps(REPO).encode()
+        self.send_response(200)
+        self.send_header('ETag', self.etag)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class UpdateStatsTest(unittest.TestCase):
+
+    def setUp(self):
+        StubGitHub.status = None
+        StubGitHub.requests = []
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StubGitHub)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.api_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp.name, 'cache.json')
+        self.session = update_stats.make_session(2)
+
+    def tearDown(self):
+        self.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def fetch(self, cache):
+        return update_stats.get_repo_stats('owner/repo', self.session, cache, self.api_url, timeout=5)
+
+    def test_etag_round_trip(self):
+        cache = update_stats.ETagCache(self.cache_path)
+        first = self.fetch(cache)
+        cache.save()
+
+        # A fresh process reloads the persisted ETag and gets a 304
+        second = self.fetch(update_stats.ETagCache(self.cache_path))
+
+        self.assertEqual(first, {"stars": 42, "last_commit_date": "2026-10-01T10:00:00Z"})
+        self.assertEqual(second, first)
+        self.assertEqual(StubGitHub.requests, [('/repos/owner/repo', None), ('/repos/owner/repo', '"v1"')])
+
+    def test_cached_stats_on_failure(self):
+        cache = update_stats.ETagCache(self.cache_path)
+        cached = self.fetch(cache)
+
+        StubGitHub.status = 500
+        self.assertEqual(self.fetch(cache), cached)
+
+        # Without a cached entry the failure falls back to N/A
+        self.assertEqual(self.fetch(update_stats.ETagCache(os.path.join(self.tmp.name, 'empty.json'))),
+                         {"stars": "N/A", "last_commit_date": "N/A"})
+
+    def test_readme_untouched_when_block_unchanged(self):
+        readme = os.path.join(self.tmp.name, 'README.md')
+        with open(readme, 'w', encoding='utf-8') as f:
+            f.write("# Repo\n<!-- START_STATS -->\n<!-- END_STATS -->\n")
+        stats = self.fetch(update_stats.ETagCache(self.cache_path))
+
+        block = update_stats.render_stats_block('owner/repo', stats, datetime(2026, 10, 1, 12, 0, 0))
+        self.assertTrue(update_stats.update_readme(readme, block))
+        with open(readme, encoding='utf-8') as f:
+            written = f.read()
+        mtime = os.stat(readme).st_mtime_ns
+
+        # Only the timestamp differs: no write
+        later = update_stats.render_stats_block('owner/repo', stats, datetime(2026, 10, 2, 8, 30, 0))
+        self.assertFalse(update_stats.update_readme(readme, later))
+        with open(readme, encoding='utf-8') as f:
+            self.assertEqual(f.read(), written)
+        self.assertEqual(os.stat(readme).st_mtime_ns, mtime)
+
+        # A real change is written
+        changed = update_stats.render_stats_block('owner/repo', dict(stats, last_commit_date='2026-10-03T00:00:00Z'),
+                                                  datetime(2026, 10, 3, 8, 30, 0))
+        self.assertTrue(update_stats.update_readme(readme, changed))
+
+if __name__ == '__main__':
+    unittest.main()